@@ -12,6 +12,8 @@ from modelos.usuario import Usuario
 from servicios.gestor_de_proyectos import GestorProyectos
 from servicios.gestor_de_tareas import GestorTareas
 from servicios.gestor_de_usuarios import GestorUsuarios
+from servicios.instantaneas import RegistroInstantaneas
+from servicios.cache_estadisticas import CacheLRU
 from utilerias.validadores import validar_cadena_no_vacia, validar_numero_positivo
 class Dashboard:
     """Clase principal del Dashboard que coordina la interfaz de usuario.
@@ -19,9 +21,10 @@ class Dashboard:
     """    
     def __init__(self):
         """Inicializa el dashboard con los gestores de servicios"""
-        self.gestor_proyectos = GestorProyectos()
-        self.gestor_tareas = GestorTareas()
-        self.gestor_usuarios = GestorUsuarios()
+        self.registro = RegistroInstantaneas()
+        self.gestor_proyectos = GestorProyectos(self.registro, CacheLRU(capacidad=256))
+        self.gestor_tareas = GestorTareas(self.registro)
+        self.gestor_usuarios = GestorUsuarios(self.registro)
         self.usuario_actual: Optional[Usuario] = None
         
         # Colores para la interfaz (ANSI escape codes)
@@ -135,7 +138,7 @@ class Dashboard:
             self.mostrar_mensaje("No hay proyectos registrados.", 'advertencia')
         else:
             for i, proyecto in enumerate(proyectos, 1):
-                progreso = proyecto.calcular_progreso()
+                progreso = self.gestor_proyectos.obtener_progreso_proyecto(proyecto.id)
                 tareas = proyecto.tareas
                 
                 # Determinar color según progreso
@@ -168,8 +171,9 @@ class Dashboard:
                 self.pausar()
                 return
             
-            estadisticas = self.gestor_proyectos.obtener_estadisticas_proyecto(proyecto_id)
-            progreso = proyecto.calcular_progreso()
+            # Estadísticas sobre una instantánea para no ver cambios a medias
+            estadisticas = self.registro.instantanea().obtener_estadisticas_proyecto(proyecto_id)
+            progreso = estadisticas['progreso']
             
             # Mostrar información del proyecto
             print(f"{self.COLORES['subtitulo']}Nombre:{self.COLORES['reset']} {proyecto.nombre}")
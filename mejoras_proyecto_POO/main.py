@@ -13,6 +13,29 @@ try:
     from servicios.gestor_de_proyectos import GestorProyectos
     from servicios.gestor_de_tareas import GestorTareas
     from servicios.gestor_de_usuarios import GestorUsuarios
+    from servicios.procesador_lotes import ProcesadorLotes
+    
+    def ejecutar_lote(argumentos):
+        """Modo por lotes: main.py --lote [archivo] [--detener-en-error]
+
+        Lee comandos JSON (uno por línea) desde el archivo o desde stdin
+        y escribe un resultado JSON por línea en stdout.
+        """
+        detener = '--detener-en-error' in argumentos
+        archivos = [a for a in argumentos if not a.startswith('--')]
+        procesador = ProcesadorLotes()
+        
+        if archivos:
+            try:
+                entrada = open(archivos[0], encoding='utf-8')
+            except OSError as e:
+                print(f"No se pudo abrir el archivo de lote: {e}", file=sys.stderr)
+                return 2
+            with entrada:
+                errores = procesador.procesar(entrada, sys.stdout, detener)
+        else:
+            errores = procesador.procesar(sys.stdin, sys.stdout, detener)
+        return 1 if errores else 0
     
     # Prueba básica del sistema
     def main():
@@ -38,6 +61,8 @@ try:
         print("\n¡Sistema funcionando correctamente!")
     
     if __name__ == "__main__":
+        if '--lote' in sys.argv:
+            sys.exit(ejecutar_lote(sys.argv[sys.argv.index('--lote') + 1:]))
         main()
 
 except ImportError as e:
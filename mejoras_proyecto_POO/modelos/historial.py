@@ -0,0 +1,73 @@
+"""Registro compacto de transiciones de estado"""
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+
+def a_milisegundos(fecha: datetime) -> int:
+    """Convierte una fecha en milisegundos desde la época Unix"""
+    return int(fecha.timestamp() * 1000)
+
+
+def desde_milisegundos(marca: int) -> datetime:
+    """Convierte milisegundos desde la época Unix en una fecha"""
+    return datetime.fromtimestamp(marca / 1000)
+
+
+class HistorialEstados:
+    """Bitácora de transiciones almacenada en arreglos de tipos primitivos.
+
+    Cada transición ocupa 9 bytes: el desplazamiento en milisegundos desde
+    la fecha base (entero de 64 bits) y el código del estado (1 byte).
+    """
+    __slots__ = ('_base', '_desplazamientos', '_codigos')
+
+    def __init__(self, fecha_inicio: datetime, codigo_inicial: int):
+        self._base = a_milisegundos(fecha_inicio)
+        self._desplazamientos = array('q', [0])
+        self._codigos = array('B', [codigo_inicial])
+
+    @property
+    def codigo_actual(self) -> int:
+        return self._codigos[-1]
+
+    def registrar(self, codigo: int, fecha: datetime):
+        """Registra una transición si el estado realmente cambia"""
+        if codigo == self._codigos[-1]:
+            return
+        self._desplazamientos.append(a_milisegundos(fecha) - self._base)
+        self._codigos.append(codigo)
+
+    def transiciones(self) -> Iterator[Tuple[int, int]]:
+        """Itera pares (marca en ms desde la época Unix, código de estado)"""
+        base = self._base
+        for desplazamiento, codigo in zip(self._desplazamientos, self._codigos):
+            yield base + desplazamiento, codigo
+
+    def codigo_en(self, marca: int) -> int:
+        """Código del estado vigente en la marca indicada (ms desde la época)"""
+        posicion = bisect_right(self._desplazamientos, marca - self._base)
+        return self._codigos[max(posicion - 1, 0)]
+
+    def milisegundos_en_estado(self, codigo: int, hasta: Optional[int] = None) -> int:
+        """Tiempo total acumulado en un estado hasta la marca indicada"""
+        if hasta is None:
+            hasta = a_milisegundos(datetime.now())
+        limite = hasta - self._base
+        total = 0
+        desplazamientos = self._desplazamientos
+        for i, actual in enumerate(self._codigos):
+            if actual != codigo:
+                continue
+            inicio = desplazamientos[i]
+            fin = desplazamientos[i + 1] if i + 1 < len(desplazamientos) else limite
+            if inicio < limite:
+                total += min(fin, limite) - inicio
+        return total
+
+    def __contains__(self, codigo: int) -> bool:
+        return codigo in self._codigos
+
+    def __len__(self):
+        return len(self._codigos)
@@ -1,13 +1,14 @@
 from datetime import datetime
 from typing import List
 from modelos.tarea import Tarea, EstadoTarea, Prioridad
+from utilerias.cadenas import internar
 
 class Proyecto:        
     """Clase que representa un proyecto con múltiples tareas"""
     def __init__(self, nombre: str, descripcion: str = ""):
-        self._nombre = nombre
-        self._descripcion = descripcion
-        self._tareas = []
+        self._nombre = internar(nombre)
+        self._descripcion = internar(descripcion)
+        self._tareas = []  # Sólo crece con append; las instantáneas comparten su prefijo
         self._fecha_inicio = datetime.now()
         self._fecha_fin_estimada = None
         self._id = id(self)
@@ -24,14 +25,18 @@ class Proyecto:
     def nombre(self, valor: str):
         if not valor or not valor.strip():
             raise ValueError("El nombre del proyecto no puede estar vacío")
-        self._nombre = valor
+        self._nombre = internar(valor)
     
     def agregar_tarea(self, tarea: Tarea):
         """Agrega una tarea al proyecto"""
         self._tareas.append(tarea)
     
+    def agregar_tareas(self, tareas: List[Tarea]):
+        """Agrega varias tareas al proyecto de una sola vez"""
+        self._tareas.extend(tareas)
+    
     def eliminar_tarea(self, tarea_id: int):
-        """Elimina una tarea del proyecto por ID"""
+        """Elimina una tarea del proyecto por ID (crea una lista nueva)"""
         self._tareas = [t for t in self._tareas if t.id != tarea_id]
     
     def obtener_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
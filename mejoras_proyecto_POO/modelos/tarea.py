@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from typing import Callable, List, Optional, Tuple
+from modelos.historial import HistorialEstados, a_milisegundos, desde_milisegundos
+from utilerias.cadenas import internar
 
 class EstadoTarea(Enum):
     """Enumeración para estados de tarea (Principio de responsabilidad única)"""
@@ -15,17 +18,24 @@ class Prioridad(Enum):
     MEDIA = 2
     ALTA = 3
     URGENTE = 4
+
+# Códigos compactos para almacenar estados en el historial
+ESTADOS_POR_CODIGO = tuple(EstadoTarea)
+CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(ESTADOS_POR_CODIGO)}
     
 class Tarea(ABC):
     """Clase abstracta base para tareas (Principio de sustitución de Liskov)"""
     
-    def __init__(self, titulo: str, descripcion: str = "", prioridad: Prioridad = Prioridad.MEDIA):
-        self._titulo = titulo
-        self._descripcion = descripcion
+    def __init__(self, titulo: str, descripcion: str = "", prioridad: Prioridad = Prioridad.MEDIA,
+                 fecha_creacion: Optional[datetime] = None):
+        self._titulo = internar(titulo)
+        self._descripcion = internar(descripcion)
         self._prioridad = prioridad
         self._estado = EstadoTarea.PENDIENTE
-        self._fecha_creacion = datetime.now()
+        self._fecha_creacion = fecha_creacion or datetime.now()
         self._fecha_completada = None
+        self._historial = HistorialEstados(self._fecha_creacion, CODIGO_ESTADO[self._estado])
+        self._observadores = None  # Se crea al primer observador para no ocupar memoria
         self._id = id(self)  # ID único basado en dirección de memoria
     
     @property
@@ -40,7 +50,7 @@ class Tarea(ABC):
     def titulo(self, valor: str):
         if not valor or not valor.strip():
             raise ValueError("El título no puede estar vacío")
-        self._titulo = valor
+        self._titulo = internar(valor)
     
     @property
     def estado(self):
@@ -48,9 +58,44 @@ class Tarea(ABC):
     
     @estado.setter
     def estado(self, nuevo_estado: EstadoTarea):
+        self._cambiar_estado(nuevo_estado, datetime.now())
+    
+    def _cambiar_estado(self, nuevo_estado: EstadoTarea, fecha: datetime):
+        """Cambia el estado registrando la transición con la fecha indicada"""
+        # Volver a marcar como completada no cambia la fecha de finalización
+        if nuevo_estado == EstadoTarea.COMPLETADA and self._estado != EstadoTarea.COMPLETADA:
+            self._fecha_completada = fecha
+        anterior = self._estado
         self._estado = nuevo_estado
-        if nuevo_estado == EstadoTarea.COMPLETADA:
-            self._fecha_completada = datetime.now()
+        self._historial.registrar(CODIGO_ESTADO[nuevo_estado], fecha)
+        if self._observadores and anterior != nuevo_estado:
+            for callback in self._observadores:
+                callback((self._id,))
+    
+    def _observar(self, callback: Callable[[Tuple[int, ...]], None]):
+        """Registra una función que recibe el ID de la tarea cuando cambia su estado"""
+        if self._observadores is None:
+            self._observadores = []
+        self._observadores.append(callback)
+    
+    def _dejar_de_observar(self, callback: Callable[[Tuple[int, ...]], None]):
+        """Quita una función registrada con _observar"""
+        if self._observadores and callback in self._observadores:
+            self._observadores.remove(callback)
+    
+    def historial_estados(self) -> List[Tuple[datetime, EstadoTarea]]:
+        """Devuelve las transiciones de estado en orden cronológico"""
+        return [(desde_milisegundos(marca), ESTADOS_POR_CODIGO[codigo])
+                for marca, codigo in self._historial.transiciones()]
+    
+    def paso_por_estado(self, estado: EstadoTarea) -> bool:
+        """Indica si la tarea estuvo alguna vez en el estado dado"""
+        return CODIGO_ESTADO[estado] in self._historial
+    
+    def tiempo_en_estado(self, estado: EstadoTarea, hasta: Optional[datetime] = None) -> float:
+        """Segundos que la tarea ha permanecido en un estado"""
+        marca = a_milisegundos(hasta) if hasta else None
+        return self._historial.milisegundos_en_estado(CODIGO_ESTADO[estado], marca) / 1000
     
     @abstractmethod
     def calcular_duracion_estimada(self) -> int:
@@ -67,8 +112,9 @@ class TareaSimple(Tarea):
     """Implementación concreta de Tarea para tareas simples"""
     
     def __init__(self, titulo: str, descripcion: str = "", 
-                 prioridad: Prioridad = Prioridad.MEDIA, horas_estimadas: int = 1):
-        super().__init__(titulo, descripcion, prioridad)
+                 prioridad: Prioridad = Prioridad.MEDIA, horas_estimadas: int = 1,
+                 fecha_creacion: Optional[datetime] = None):
+        super().__init__(titulo, descripcion, prioridad, fecha_creacion)
         self._horas_estimadas = max(1, horas_estimadas)
     
     def calcular_duracion_estimada(self) -> int:
@@ -88,8 +134,9 @@ class TareaCompuesta(Tarea):
     """Implementación para tareas compuestas (pueden contener subtareas)"""
     
     def __init__(self, titulo: str, descripcion: str = "", 
-                 prioridad: Prioridad = Prioridad.MEDIA):
-        super().__init__(titulo, descripcion, prioridad)
+                 prioridad: Prioridad = Prioridad.MEDIA,
+                 fecha_creacion: Optional[datetime] = None):
+        super().__init__(titulo, descripcion, prioridad, fecha_creacion)
         self._subtareas = []
     
     def agregar_subtarea(self, subtarea: Tarea):
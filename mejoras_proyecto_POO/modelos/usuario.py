@@ -1,16 +1,35 @@
-from typing import List
+from enum import Enum
+from typing import List, Union
 from modelos.proyecto import Proyecto
+from utilerias.cadenas import internar
+
+class RolUsuario(Enum):
+    """Enumeración para los roles de usuario (una instancia compartida por rol)"""
+    ESTUDIANTE = "estudiante"
+    PROFESOR = "profesor"
+    ADMIN = "admin"
 
 class Usuario:
     """Clase que representa un usuario del sistema"""
     
-    def __init__(self, nombre: str, email: str, rol: str = "estudiante"):
-        self._nombre = nombre
+    def __init__(self, nombre: str, email: str, rol: Union[str, RolUsuario] = RolUsuario.ESTUDIANTE):
+        self._nombre = internar(nombre)
         self._email = email
-        self._rol = rol
+        self._rol = self._convertir_rol(rol)
         self._proyectos = []
         self._id = id(self)
     
+    @staticmethod
+    def _convertir_rol(rol: Union[str, RolUsuario]) -> RolUsuario:
+        """Convierte el rol recibido como texto en su código compacto"""
+        if isinstance(rol, RolUsuario):
+            return rol
+        try:
+            return RolUsuario(rol.strip().lower())
+        except ValueError:
+            roles = ", ".join(r.value for r in RolUsuario)
+            raise ValueError(f"Rol inválido: '{rol}'. Roles válidos: {roles}")
+    
     @property
     def id(self):
         return self._id
@@ -24,7 +43,11 @@ class Usuario:
         return self._email
     
     @property
-    def rol(self):
+    def rol(self) -> str:
+        return self._rol.value
+    
+    @property
+    def codigo_rol(self) -> RolUsuario:
         return self._rol
     
     def agregar_proyecto(self, proyecto: Proyecto):
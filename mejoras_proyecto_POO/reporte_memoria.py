@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Reporte de memoria de las cadenas compartidas en los modelos
+Genera un conjunto de datos sintético y muestra cuánto se ahorra al internar
+títulos, descripciones y nombres, y al guardar los roles como enumeración
+"""
+import random
+import sys
+import os
+from typing import Dict, Iterable, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modelos.usuario import Usuario
+from servicios.gestor_de_proyectos import GestorProyectos
+from servicios.gestor_de_tareas import GestorTareas
+from servicios.gestor_de_usuarios import GestorUsuarios
+
+PLANTILLAS_TAREAS = [
+    ("Revisar pull request", "Revisar el código y dejar comentarios antes de aprobar"),
+    ("Escribir pruebas unitarias", "Cubrir los casos principales y los casos borde"),
+    ("Actualizar documentación", "Reflejar los cambios de la iteración en el README"),
+    ("Reunión de seguimiento", "Revisar avances y bloqueos del equipo"),
+    ("Corregir errores reportados", "Atender los errores abiertos con prioridad alta"),
+    ("Preparar entrega", "Empaquetar el proyecto y verificar que ejecute correctamente"),
+]
+ROLES = ["estudiante"] * 8 + ["profesor", "admin"]
+
+
+def _copia(texto: str) -> str:
+    """Crea una cadena nueva con el mismo contenido, como si viniera de un archivo"""
+    return "".join(list(texto))
+
+
+def generar_datos(num_usuarios: int, num_proyectos: int, tareas_por_proyecto: int,
+                  semilla: int = 8) -> Tuple[GestorUsuarios, GestorProyectos, GestorTareas]:
+    """Genera usuarios, proyectos y tareas con textos repetidos de plantillas"""
+    aleatorio = random.Random(semilla)
+    gestor_usuarios = GestorUsuarios()
+    gestor_proyectos = GestorProyectos()
+    gestor_tareas = GestorTareas()
+
+    usuarios = [
+        gestor_usuarios.registrar_usuario(
+            _copia(f"Usuario {i % 50}"), f"usuario{i}@example.com", _copia(aleatorio.choice(ROLES))
+        )
+        for i in range(num_usuarios)
+    ]
+
+    for p in range(num_proyectos):
+        proyecto = gestor_proyectos.crear_proyecto(
+            _copia(f"Sprint {p % 20}"), _copia("Proyecto generado para el reporte de memoria")
+        )
+        aleatorio.choice(usuarios).agregar_proyecto(proyecto)
+        for _ in range(tareas_por_proyecto):
+            titulo, descripcion = aleatorio.choice(PLANTILLAS_TAREAS)
+            if aleatorio.random() < 0.3:
+                # Variantes casi idénticas: la plantilla con el número de sprint
+                titulo = f"{titulo} (sprint {p % 20})"
+            tarea = gestor_tareas.crear_tarea_simple(_copia(titulo), _copia(descripcion))
+            gestor_proyectos.agregar_tarea_a_proyecto(proyecto.id, tarea)
+
+    return gestor_usuarios, gestor_proyectos, gestor_tareas
+
+
+def medir_campo(valores: Iterable[str]) -> Dict:
+    """Compara el tamaño de un campo con una copia por objeto contra instancias compartidas"""
+    referencias = 0
+    bytes_sin_compartir = 0
+    unicas = {}
+    for valor in valores:
+        referencias += 1
+        tamano = sys.getsizeof(valor)
+        bytes_sin_compartir += tamano
+        unicas[id(valor)] = tamano
+    return {
+        'referencias': referencias,
+        'instancias': len(unicas),
+        'bytes_sin_compartir': bytes_sin_compartir,
+        'bytes_compartidos': sum(unicas.values()),
+    }
+
+
+def generar_reporte(gestor_usuarios: GestorUsuarios, gestor_proyectos: GestorProyectos,
+                    gestor_tareas: GestorTareas) -> Dict[str, Dict]:
+    """Mide cada campo de texto de los modelos"""
+    usuarios: List[Usuario] = gestor_usuarios.listar_usuarios()
+    proyectos = gestor_proyectos.listar_proyectos()
+    tareas = list(gestor_tareas._tareas.values())
+    return {
+        'Usuario.nombre': medir_campo(u.nombre for u in usuarios),
+        'Usuario.rol': medir_campo(u.rol for u in usuarios),
+        'Proyecto.nombre': medir_campo(p.nombre for p in proyectos),
+        'Proyecto.descripcion': medir_campo(p._descripcion for p in proyectos),
+        'Tarea.titulo': medir_campo(t.titulo for t in tareas),
+        'Tarea.descripcion': medir_campo(t._descripcion for t in tareas),
+    }
+
+
+def mostrar_reporte(reporte: Dict[str, Dict]):
+    """Imprime el reporte en forma de tabla"""
+    print(f"{'Campo':<22}{'Refs':>10}{'Únicas':>10}{'Sin compartir':>16}{'Compartido':>14}")
+    total_sin, total_con = 0, 0
+    for campo, datos in reporte.items():
+        total_sin += datos['bytes_sin_compartir']
+        total_con += datos['bytes_compartidos']
+        print(f"{campo:<22}{datos['referencias']:>10}{datos['instancias']:>10}"
+              f"{datos['bytes_sin_compartir']:>16,}{datos['bytes_compartidos']:>14,}")
+    ahorro = total_sin - total_con
+    porcentaje = (ahorro / total_sin * 100) if total_sin else 0.0
+    print(f"\nTotal sin compartir: {total_sin:,} bytes")
+    print(f"Total compartido:    {total_con:,} bytes")
+    print(f"Ahorro:              {ahorro:,} bytes ({porcentaje:.1f}%)")
+
+
+if __name__ == "__main__":
+    tareas_por_proyecto = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print("=== REPORTE DE MEMORIA DE CADENAS ===\n")
+    mostrar_reporte(generar_reporte(*generar_datos(1000, 1000, tareas_por_proyecto)))
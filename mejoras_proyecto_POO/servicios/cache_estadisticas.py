@@ -0,0 +1,84 @@
+"""Caché LRU con expiración opcional para resultados costosos de calcular"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class CacheLRU:
+    """Caché de tamaño acotado que desaloja el elemento usado hace más tiempo.
+
+    Si se indica ttl (en segundos), las entradas más antiguas que ese tiempo
+    se consideran vencidas y se vuelven a calcular.
+    """
+
+    def __init__(self, capacidad: int = 128, ttl: Optional[float] = None,
+                 reloj: Callable[[], float] = time.monotonic):
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("El ttl debe ser un número positivo")
+        self._capacidad = capacidad
+        self._ttl = ttl
+        self._reloj = reloj
+        self._entradas = OrderedDict()
+        self._aciertos = 0
+        self._fallos = 0
+        self._desalojos = 0
+
+    @property
+    def aciertos(self) -> int:
+        return self._aciertos
+
+    @property
+    def fallos(self) -> int:
+        return self._fallos
+
+    @property
+    def desalojos(self) -> int:
+        return self._desalojos
+
+    def obtener_o_calcular(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """Devuelve el valor guardado o lo calcula y lo guarda"""
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            valor, expira = entrada
+            if expira is None or expira > self._reloj():
+                self._entradas.move_to_end(clave)
+                self._aciertos += 1
+                return valor
+            del self._entradas[clave]
+
+        self._fallos += 1
+        valor = calcular()
+        self.guardar(clave, valor)
+        return valor
+
+    def guardar(self, clave: Hashable, valor: Any):
+        """Guarda un valor, desalojando el menos usado si la caché está llena"""
+        expira = self._reloj() + self._ttl if self._ttl is not None else None
+        self._entradas[clave] = (valor, expira)
+        self._entradas.move_to_end(clave)
+        if len(self._entradas) > self._capacidad:
+            self._entradas.popitem(last=False)
+            self._desalojos += 1
+
+    def invalidar(self, clave: Hashable) -> bool:
+        """Elimina una entrada; devuelve True si existía"""
+        return self._entradas.pop(clave, None) is not None
+
+    def limpiar(self):
+        """Elimina todas las entradas sin reiniciar los contadores"""
+        self._entradas.clear()
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Contadores de uso de la caché"""
+        return {
+            'entradas': len(self._entradas),
+            'capacidad': self._capacidad,
+            'aciertos': self._aciertos,
+            'fallos': self._fallos,
+            'desalojos': self._desalojos,
+        }
+
+    def __len__(self):
+        return len(self._entradas)
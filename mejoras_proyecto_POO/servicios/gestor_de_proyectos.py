@@ -1,12 +1,18 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 from modelos.proyecto import Proyecto
 from modelos.tarea import Tarea, EstadoTarea
+from servicios.instantaneas import RegistroInstantaneas
+from servicios.cache_estadisticas import CacheLRU
 
 class GestorProyectos:
     """Servicio para gestionar operaciones relacionadas con proyectos"""
     
-    def __init__(self):
+    def __init__(self, registro: Optional[RegistroInstantaneas] = None,
+                 cache: Optional[CacheLRU] = None):
         self._proyectos = {}
+        self._registro = registro
+        self._cache = cache
+        self._proyectos_por_tarea = {}  # Sólo se mantiene si hay caché
     
     def crear_proyecto(self, nombre: str, descripcion: str = "") -> Proyecto:
         """Crea un nuevo proyecto"""
@@ -14,7 +20,7 @@ class GestorProyectos:
             raise ValueError("El nombre del proyecto no puede estar vacío")
         
         proyecto = Proyecto(nombre, descripcion)
-        self._proyectos[proyecto.id] = proyecto
+        self._registrar_proyecto(proyecto)
         return proyecto
     
     def obtener_proyecto(self, proyecto_id: int) -> Proyecto:
@@ -24,7 +30,19 @@ class GestorProyectos:
     def eliminar_proyecto(self, proyecto_id: int) -> bool:
         """Elimina un proyecto por ID"""
         if proyecto_id in self._proyectos:
-            del self._proyectos[proyecto_id]
+            proyecto = self._proyectos.pop(proyecto_id)
+            if self._cache is not None:
+                self._cache.invalidar(proyecto_id)
+                for tarea in proyecto._tareas:
+                    proyectos = self._proyectos_por_tarea.get(tarea.id)
+                    if proyectos is None:
+                        continue
+                    proyectos.discard(proyecto_id)
+                    if not proyectos:
+                        del self._proyectos_por_tarea[tarea.id]
+                        tarea._dejar_de_observar(self.notificar_cambio_tareas)
+            if self._registro:
+                self._registro.retirar_proyecto(proyecto_id)
             return True
         return False
     
@@ -33,19 +51,98 @@ class GestorProyectos:
         return list(self._proyectos.values())
     
     def agregar_tarea_a_proyecto(self, proyecto_id: int, tarea: Tarea) -> bool:
-        """Agrega una tarea a un proyecto específico"""
+        """Agrega una tarea a un proyecto específico.
+
+        A diferencia de agregar_tareas_a_proyecto no comprueba si la tarea ya
+        pertenece al proyecto, para que agregar una tarea siga costando O(1).
+        """
         proyecto = self.obtener_proyecto(proyecto_id)
         if proyecto:
             proyecto.agregar_tarea(tarea)
+            self._tareas_agregadas(proyecto_id, (tarea,))
+            if self._registro:
+                self._registro.publicar_proyecto(proyecto, (tarea,))
             return True
         return False
     
+    def agregar_tareas_a_proyecto(self, proyecto_id: int, tareas: Iterable[Tarea]) -> List[bool]:
+        """Agrega varias tareas a un proyecto en un solo lote.
+
+        Devuelve, para cada tarea, si fue agregada. Las tareas que ya
+        pertenecen al proyecto (o se repiten en el lote) no se agregan.
+        """
+        tareas = list(tareas)
+        proyecto = self.obtener_proyecto(proyecto_id)
+        if not proyecto:
+            return [False] * len(tareas)
+        
+        existentes = {t.id for t in proyecto._tareas}
+        nuevas = []
+        resultados = []
+        for tarea in tareas:
+            agregada = tarea.id not in existentes
+            if agregada:
+                existentes.add(tarea.id)
+                nuevas.append(tarea)
+            resultados.append(agregada)
+        
+        if nuevas:
+            proyecto.agregar_tareas(nuevas)
+            self._tareas_agregadas(proyecto_id, nuevas)
+            if self._registro:
+                self._registro.publicar_proyecto(proyecto, nuevas)
+        return resultados
+    
+    def notificar_cambio_tareas(self, tarea_ids: Iterable[int]):
+        """Invalida en la caché los proyectos que contienen las tareas modificadas.
+
+        Con caché, el gestor observa cada tarea que agrega a un proyecto, así
+        que cualquier cambio de estado (por el gestor de tareas o directo
+        sobre la tarea) llega aquí sin más configuración.
+        """
+        if self._cache is None:
+            return
+        for tarea_id in tarea_ids:
+            for proyecto_id in self._proyectos_por_tarea.get(tarea_id, ()):
+                self._cache.invalidar(proyecto_id)
+    
     def obtener_estadisticas_proyecto(self, proyecto_id: int) -> Dict:
         """Obtiene estadísticas detalladas de un proyecto"""
         proyecto = self.obtener_proyecto(proyecto_id)
         if not proyecto:
             return {}
+        if self._cache is None:
+            return self._calcular_estadisticas(proyecto)
         
+        estadisticas = self._cache.obtener_o_calcular(
+            proyecto_id, lambda: self._calcular_estadisticas(proyecto)
+        )
+        return dict(estadisticas)
+    
+    def obtener_progreso_proyecto(self, proyecto_id: int) -> float:
+        """Obtiene el porcentaje de progreso de un proyecto (usa la caché si existe)"""
+        return self.obtener_estadisticas_proyecto(proyecto_id).get('progreso', 0.0)
+    
+    def _registrar_proyecto(self, proyecto: Proyecto):
+        """Método privado para registrar un proyecto recién creado"""
+        self._proyectos[proyecto.id] = proyecto
+        if self._registro:
+            self._registro.publicar_proyecto(proyecto)
+    
+    def _tareas_agregadas(self, proyecto_id: int, tareas: Iterable[Tarea]):
+        """Método privado: registra la pertenencia de las tareas e invalida la caché"""
+        if self._cache is None:
+            return
+        self._cache.invalidar(proyecto_id)
+        for tarea in tareas:
+            proyectos = self._proyectos_por_tarea.get(tarea.id)
+            if proyectos is None:
+                proyectos = self._proyectos_por_tarea[tarea.id] = set()
+                tarea._observar(self.notificar_cambio_tareas)
+            proyectos.add(proyecto_id)
+    
+    def _calcular_estadisticas(self, proyecto: Proyecto) -> Dict:
+        """Método privado que calcula las estadísticas sin caché"""
         tareas = proyecto.tareas
         total_tareas = len(tareas)
         
@@ -55,4 +152,22 @@ class GestorProyectos:
             'tareas_en_progreso': len(proyecto.obtener_tareas_por_estado(EstadoTarea.EN_PROGRESO)),
             'tareas_completadas': len(proyecto.obtener_tareas_por_estado(EstadoTarea.COMPLETADA)),
             'progreso': proyecto.calcular_progreso()
-        }
\ No newline at end of file
+        }
+    
+    def tiempo_promedio_en_estado(self, proyecto_id: int,
+                                  estado: EstadoTarea = EstadoTarea.EN_PROGRESO) -> Optional[float]:
+        """Promedio en segundos que las tareas del proyecto pasaron en un estado.
+
+        Sólo considera las tareas que alguna vez estuvieron en ese estado. Se
+        calcula recorriendo el historial compacto de cada tarea del proyecto
+        (no el índice temporal, que está organizado por fecha y no por proyecto).
+        """
+        proyecto = self.obtener_proyecto(proyecto_id)
+        if not proyecto:
+            return None
+        
+        tiempos = [t.tiempo_en_estado(estado) for t in proyecto.tareas
+                   if t.paso_por_estado(estado)]
+        if not tiempos:
+            return None
+        return sum(tiempos) / len(tiempos)
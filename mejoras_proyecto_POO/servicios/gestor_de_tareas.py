@@ -1,38 +1,113 @@
-from typing import List, Dict
-from modelos.tarea import Tarea, TareaSimple, TareaCompuesta, EstadoTarea, Prioridad
+from typing import Callable, List, Dict, Iterable, Optional, Sequence
+from datetime import datetime
+from modelos.tarea import Tarea, TareaSimple, TareaCompuesta, EstadoTarea, Prioridad, CODIGO_ESTADO
+from servicios.indice_temporal import IndiceTemporal
+from servicios.instantaneas import RegistroInstantaneas
 
 class GestorTareas:
     """Servicio para gestionar operaciones relacionadas con tareas"""
     
-    def __init__(self):
+    def __init__(self, registro: Optional[RegistroInstantaneas] = None):
         self._tareas = {}
+        self._indice = IndiceTemporal()
+        self._registro = registro
+        self._suscriptores = []
+    
+    def suscribir(self, callback: Callable[[List[int]], None]):
+        """Registra una función que recibe los IDs de tareas cuyo estado cambió"""
+        self._suscriptores.append(callback)
     
     def crear_tarea_simple(self, titulo: str, descripcion: str = "", 
                           prioridad: Prioridad = Prioridad.MEDIA, 
                           horas_estimadas: int = 1) -> TareaSimple:
         """Crea una nueva tarea simple"""
         tarea = TareaSimple(titulo, descripcion, prioridad, horas_estimadas)
-        self._tareas[tarea.id] = tarea
+        self._registrar_tarea(tarea)
         return tarea
     
     def crear_tarea_compuesta(self, titulo: str, descripcion: str = "", 
                              prioridad: Prioridad = Prioridad.MEDIA) -> TareaCompuesta:
         """Crea una nueva tarea compuesta"""
         tarea = TareaCompuesta(titulo, descripcion, prioridad)
-        self._tareas[tarea.id] = tarea
+        self._registrar_tarea(tarea)
         return tarea
     
+    def crear_tareas_simples(self, filas: Iterable[Sequence]) -> List[TareaSimple]:
+        """Crea varias tareas simples en un solo lote.
+
+        Cada fila es (titulo[, descripcion[, prioridad[, horas_estimadas]]]).
+        Todas las filas se validan antes de crear cualquier tarea y todas
+        comparten la misma fecha de creación.
+        """
+        filas = [tuple(fila) for fila in filas]
+        errores = [(i, error) for i, error in enumerate(map(self._validar_fila, filas)) if error]
+        if errores:
+            detalle = ', '.join(f"{i} ({error})" for i, error in errores)
+            raise ValueError(f"Filas inválidas: {detalle}")
+        
+        fecha = datetime.now()
+        tareas = [TareaSimple(*fila, fecha_creacion=fecha) for fila in filas]
+        self._registrar_tareas(tareas, fecha)
+        return tareas
+    
     def obtener_tarea(self, tarea_id: int) -> Tarea:
         """Obtiene una tarea por ID"""
         return self._tareas.get(tarea_id)
     
     def actualizar_estado_tarea(self, tarea_id: int, estado: EstadoTarea) -> bool:
         """Actualiza el estado de una tarea"""
-        tarea = self.obtener_tarea(tarea_id)
-        if tarea:
-            tarea.estado = estado
-            return True
-        return False
+        return self.actualizar_estados((tarea_id,), estado)[0]
+    
+    def actualizar_estados(self, tarea_ids: Iterable[int], estado: EstadoTarea,
+                           fecha: Optional[datetime] = None) -> List[bool]:
+        """Actualiza el estado de varias tareas con una sola fecha.
+
+        Si no se indica la fecha se usa la actual. Devuelve, para cada ID,
+        si la tarea existía y fue actualizada.
+        """
+        if not isinstance(estado, EstadoTarea):
+            raise ValueError(f"Estado inválido: {estado}")
+        
+        fecha = fecha or datetime.now()
+        resultados = []
+        actualizadas = []
+        cambiadas = []
+        for tarea_id in tarea_ids:
+            tarea = self._tareas.get(tarea_id)
+            if tarea is None:
+                resultados.append(False)
+                continue
+            if tarea.estado != estado:
+                cambiadas.append(tarea.id)
+            tarea._cambiar_estado(estado, fecha)
+            actualizadas.append(tarea)
+            resultados.append(True)
+        
+        self._indice.registrar_lote(CODIGO_ESTADO[estado], cambiadas, fecha)
+        if self._registro and actualizadas:
+            self._registro.publicar_tareas(actualizadas)
+        if cambiadas:
+            for callback in self._suscriptores:
+                callback(cambiadas)
+        return resultados
+    
+    def obtener_tareas_completadas_entre(self, desde: datetime, hasta: datetime) -> List[Tarea]:
+        """Obtiene las tareas completadas entre dos fechas que siguen completadas.
+
+        Sólo cuenta la finalización vigente: una tarea reabierta y completada
+        de nuevo aparece en el rango de su última finalización.
+        """
+        return [t for t in self.obtener_tareas_que_entraron_en(EstadoTarea.COMPLETADA, desde, hasta)
+                if t.estado == EstadoTarea.COMPLETADA and desde <= t._fecha_completada <= hasta]
+    
+    def obtener_tareas_que_entraron_en(self, estado: EstadoTarea,
+                                       desde: datetime, hasta: datetime) -> List[Tarea]:
+        """Obtiene las tareas que pasaron a un estado entre dos fechas.
+
+        Usa el índice temporal; incluye tareas que después cambiaron a otro estado.
+        """
+        ids = self._indice.consultar(CODIGO_ESTADO[estado], desde, hasta)
+        return [self._tareas[i] for i in ids if i in self._tareas]
     
     def filtrar_tareas_por_prioridad(self, prioridad: Prioridad) -> List[Tarea]:
         """Filtra tareas por prioridad"""
@@ -46,6 +121,38 @@ class GestorTareas:
         """Obtiene todas las tareas completadas"""
         return self._filtrar_tareas_por_estado(EstadoTarea.COMPLETADA)
     
+    @staticmethod
+    def _validar_fila(fila: tuple) -> Optional[str]:
+        """Método privado: devuelve el error de una fila o None si es válida"""
+        if not 1 <= len(fila) <= 4:
+            return "se esperan de 1 a 4 columnas"
+        if not isinstance(fila[0], str) or not fila[0].strip():
+            return "título vacío"
+        if len(fila) > 1 and not isinstance(fila[1], str):
+            return "descripción inválida"
+        if len(fila) > 2 and not isinstance(fila[2], Prioridad):
+            return "prioridad inválida"
+        if len(fila) > 3 and (isinstance(fila[3], bool) or not isinstance(fila[3], int)
+                              or fila[3] < 1):
+            return "horas estimadas inválidas"
+        return None
+    
+    def _registrar_tarea(self, tarea: Tarea):
+        """Método privado para registrar una tarea recién creada"""
+        self._tareas[tarea.id] = tarea
+        self._indice.registrar(CODIGO_ESTADO[tarea.estado], tarea.id, tarea._fecha_creacion)
+        if self._registro:
+            self._registro.publicar_tareas((tarea,))
+    
+    def _registrar_tareas(self, tareas: List[Tarea], fecha: datetime):
+        """Método privado para registrar tareas pendientes creadas en la misma fecha"""
+        for tarea in tareas:
+            self._tareas[tarea.id] = tarea
+        self._indice.registrar_lote(CODIGO_ESTADO[EstadoTarea.PENDIENTE],
+                                    [t.id for t in tareas], fecha)
+        if self._registro:
+            self._registro.publicar_tareas(tareas)
+    
     def _filtrar_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
         """Método privado para filtrar tareas por estado"""
         return [t for t in self._tareas.values() if t.estado == estado]
\ No newline at end of file
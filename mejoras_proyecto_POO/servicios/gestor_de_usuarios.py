@@ -1,13 +1,17 @@
-from typing import List, Optional
-from modelos.usuario import Usuario
+from typing import List, Optional, Union
+from modelos.usuario import Usuario, RolUsuario
+from servicios.instantaneas import RegistroInstantaneas
 
 class GestorUsuarios:
     """Servicio para gestionar operaciones relacionadas con usuarios"""
     
-    def __init__(self):
+    def __init__(self, registro: Optional[RegistroInstantaneas] = None):
         self._usuarios = {}
+        self._registro = registro
+        self._usuarios_por_email = {}  # Índice para evitar recorrer todos los usuarios
     
-    def registrar_usuario(self, nombre: str, email: str, rol: str = "estudiante") -> Usuario:
+    def registrar_usuario(self, nombre: str, email: str,
+                          rol: Union[str, RolUsuario] = RolUsuario.ESTUDIANTE) -> Usuario:
         """Registra un nuevo usuario en el sistema"""
         if not nombre or not nombre.strip():
             raise ValueError("El nombre no puede estar vacío")
@@ -20,19 +24,23 @@ class GestorUsuarios:
             raise ValueError("El email ya está registrado")
         
         usuario = Usuario(nombre, email, rol)
-        self._usuarios[usuario.id] = usuario
+        self._registrar_usuario(usuario)
         return usuario
     
     def obtener_usuario(self, usuario_id: int) -> Optional[Usuario]:
         """Obtiene un usuario por ID"""
         return self._usuarios.get(usuario_id)
     
+    def _registrar_usuario(self, usuario: Usuario):
+        """Registra un usuario ya validado (método privado)"""
+        self._usuarios[usuario.id] = usuario
+        self._usuarios_por_email[usuario.email] = usuario
+        if self._registro:
+            self._registro.publicar_usuario(usuario)
+    
     def _buscar_usuario_por_email(self, email: str) -> Optional[Usuario]:
         """Busca un usuario por email (método privado)"""
-        for usuario in self._usuarios.values():
-            if usuario.email == email:
-                return usuario
-        return None
+        return self._usuarios_por_email.get(email)
     
     def _validar_email(self, email: str) -> bool:
         """Valida el formato del email (método privado)"""
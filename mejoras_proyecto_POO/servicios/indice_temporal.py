@@ -0,0 +1,64 @@
+"""Índice temporal de transiciones de estado para consultas por rango de fechas"""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import repeat
+from typing import List, Sequence
+
+from modelos.historial import a_milisegundos
+
+
+class IndiceTemporal:
+    """Índice ordenado por fecha de las transiciones hacia cada estado.
+
+    Por cada código de estado se guardan dos arreglos paralelos: las marcas
+    en milisegundos (ordenadas) y los IDs de las tareas correspondientes.
+    """
+
+    def __init__(self):
+        self._marcas = {}
+        self._ids = {}
+
+    def registrar(self, codigo: int, tarea_id: int, fecha: datetime):
+        """Registra la entrada de una tarea a un estado"""
+        marcas = self._marcas.get(codigo)
+        if marcas is None:
+            marcas = self._marcas[codigo] = array('q')
+            self._ids[codigo] = array('q')
+        ids = self._ids[codigo]
+        marca = a_milisegundos(fecha)
+
+        # Las transiciones suelen llegar en orden; sólo se busca si no es así
+        if not marcas or marcas[-1] <= marca:
+            marcas.append(marca)
+            ids.append(tarea_id)
+        else:
+            posicion = bisect_right(marcas, marca)
+            marcas.insert(posicion, marca)
+            ids.insert(posicion, tarea_id)
+
+    def registrar_lote(self, codigo: int, tarea_ids: Sequence[int], fecha: datetime):
+        """Registra varias tareas que entraron al mismo estado en la misma fecha"""
+        if not tarea_ids:
+            return
+        marca = a_milisegundos(fecha)
+        marcas = self._marcas.get(codigo)
+        if marcas and marcas[-1] > marca:
+            for tarea_id in tarea_ids:
+                self.registrar(codigo, tarea_id, fecha)
+            return
+
+        if marcas is None:
+            marcas = self._marcas[codigo] = array('q')
+            self._ids[codigo] = array('q')
+        marcas.extend(repeat(marca, len(tarea_ids)))
+        self._ids[codigo].extend(tarea_ids)
+
+    def consultar(self, codigo: int, desde: datetime, hasta: datetime) -> List[int]:
+        """IDs de tareas que entraron al estado entre dos fechas (inclusive)"""
+        marcas = self._marcas.get(codigo)
+        if not marcas:
+            return []
+        inicio = bisect_left(marcas, a_milisegundos(desde))
+        fin = bisect_right(marcas, a_milisegundos(hasta))
+        return list(dict.fromkeys(self._ids[codigo][inicio:fin]))
@@ -0,0 +1,248 @@
+"""Instantáneas de solo lectura sobre el estado de los gestores.
+
+Los gestores que reciben un RegistroInstantaneas publican en él una vista
+inmutable de cada objeto que modifican. Las vistas se guardan en mapas
+divididos en NUM_FRAGMENTOS diccionarios según el ID. Una instantánea
+comparte los fragmentos vigentes (costo constante: copia la tupla de
+fragmentos, no su contenido) y el siguiente escritor copia sólo el
+fragmento que modifica, es decir O(n / NUM_FRAGMENTOS) la primera vez que
+toca cada fragmento después de una instantánea. Los lectores nunca ven
+estados a medio actualizar.
+"""
+import threading
+from collections.abc import Mapping as MappingABC
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from modelos.proyecto import Proyecto
+from modelos.tarea import Tarea, EstadoTarea, Prioridad
+from modelos.usuario import Usuario
+
+
+NUM_FRAGMENTOS = 256
+_MASCARA_64 = (1 << 64) - 1
+
+
+def _fragmento(clave: Hashable) -> int:
+    """Fragmento de una clave; se mezcla el hash porque los IDs son direcciones alineadas"""
+    return ((hash(clave) * 0x9E3779B97F4A7C15) & _MASCARA_64) >> 56
+
+
+class MapaFragmentado(MappingABC):
+    """Mapa de solo lectura formado por fragmentos que ya nadie modifica"""
+    __slots__ = ('_fragmentos', '_longitud')
+
+    def __init__(self, fragmentos: Tuple[Dict, ...]):
+        self._fragmentos = fragmentos
+        self._longitud = None
+
+    def __getitem__(self, clave):
+        return self._fragmentos[_fragmento(clave)][clave]
+
+    def __contains__(self, clave) -> bool:
+        return clave in self._fragmentos[_fragmento(clave)]
+
+    def __iter__(self) -> Iterator:
+        for fragmento in self._fragmentos:
+            yield from fragmento
+
+    def __len__(self) -> int:
+        if self._longitud is None:
+            self._longitud = sum(len(f) for f in self._fragmentos)
+        return self._longitud
+
+
+class _MapaCopiaAlEscribir:
+    """Mapa del escritor: copia un fragmento sólo si una instantánea lo comparte"""
+
+    def __init__(self):
+        self._fragmentos = [{} for _ in range(NUM_FRAGMENTOS)]
+        self._propios = bytearray(b'\x01' * NUM_FRAGMENTOS)
+
+    def congelar(self) -> MapaFragmentado:
+        """Entrega los fragmentos actuales como mapa de solo lectura"""
+        self._propios = bytearray(NUM_FRAGMENTOS)
+        return MapaFragmentado(tuple(self._fragmentos))
+
+    def asignar(self, clave: Hashable, valor: Any):
+        self._fragmento_para_escritura(clave)[clave] = valor
+
+    def quitar(self, clave: Hashable):
+        self._fragmento_para_escritura(clave).pop(clave, None)
+
+    def _fragmento_para_escritura(self, clave: Hashable) -> Dict:
+        indice = _fragmento(clave)
+        if not self._propios[indice]:
+            self._fragmentos[indice] = dict(self._fragmentos[indice])
+            self._propios[indice] = 1
+        return self._fragmentos[indice]
+
+
+class VistaTarea(NamedTuple):
+    """Copia inmutable de una tarea"""
+    id: int
+    titulo: str
+    estado: EstadoTarea
+    prioridad: Prioridad
+    duracion_estimada: int
+    fecha_completada: Optional[datetime]
+
+    @classmethod
+    def desde(cls, tarea: Tarea) -> "VistaTarea":
+        return cls(tarea.id, tarea.titulo, tarea.estado, tarea._prioridad,
+                   tarea.calcular_duracion_estimada(), tarea._fecha_completada)
+
+
+class VistaProyecto(NamedTuple):
+    """Vista inmutable de un proyecto.
+
+    La lista de tareas del proyecto sólo crece con append (eliminar crea una
+    lista nueva), así que la vista comparte la lista y recuerda su longitud:
+    el prefijo visible nunca cambia y publicar el proyecto cuesta O(1).
+    """
+    id: int
+    nombre: str
+    descripcion: str
+    lista_tareas: List[Tarea]
+    num_tareas: int
+
+    @classmethod
+    def desde(cls, proyecto: Proyecto) -> "VistaProyecto":
+        return cls(proyecto.id, proyecto.nombre, proyecto._descripcion,
+                   proyecto._tareas, len(proyecto._tareas))
+
+    @property
+    def tareas(self) -> Tuple[int, ...]:
+        """IDs de las tareas del proyecto en el momento de la vista"""
+        return tuple(self.lista_tareas[i].id for i in range(self.num_tareas))
+
+
+class VistaUsuario(NamedTuple):
+    """Copia inmutable de un usuario"""
+    id: int
+    nombre: str
+    email: str
+    rol: str
+
+    @classmethod
+    def desde(cls, usuario: Usuario) -> "VistaUsuario":
+        return cls(usuario.id, usuario.nombre, usuario.email, usuario.rol)
+
+
+class Instantanea:
+    """Vista consistente de todos los gestores en un punto del tiempo"""
+
+    def __init__(self, version: int, tareas: Mapping[int, VistaTarea],
+                 proyectos: Mapping[int, VistaProyecto], usuarios: Mapping[int, VistaUsuario]):
+        self._version = version
+        self._tareas = tareas
+        self._proyectos = proyectos
+        self._usuarios = usuarios
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def tareas(self) -> Mapping[int, VistaTarea]:
+        return self._tareas
+
+    @property
+    def proyectos(self) -> Mapping[int, VistaProyecto]:
+        return self._proyectos
+
+    @property
+    def usuarios(self) -> Mapping[int, VistaUsuario]:
+        return self._usuarios
+
+    def tareas_de_proyecto(self, proyecto_id: int) -> List[VistaTarea]:
+        """Obtiene las vistas de las tareas de un proyecto"""
+        proyecto = self._proyectos.get(proyecto_id)
+        if not proyecto:
+            return []
+        return [self._tareas[i] for i in proyecto.tareas if i in self._tareas]
+
+    def obtener_estadisticas_proyecto(self, proyecto_id: int) -> Dict:
+        """Mismas estadísticas que GestorProyectos, calculadas sobre la instantánea"""
+        if proyecto_id not in self._proyectos:
+            return {}
+
+        conteo = {estado: 0 for estado in EstadoTarea}
+        tareas = self.tareas_de_proyecto(proyecto_id)
+        for tarea in tareas:
+            conteo[tarea.estado] += 1
+        total_tareas = len(tareas)
+        completadas = conteo[EstadoTarea.COMPLETADA]
+
+        return {
+            'total_tareas': total_tareas,
+            'tareas_pendientes': conteo[EstadoTarea.PENDIENTE],
+            'tareas_en_progreso': conteo[EstadoTarea.EN_PROGRESO],
+            'tareas_completadas': completadas,
+            'progreso': (completadas / total_tareas) * 100 if total_tareas else 0.0
+        }
+
+    def exportar(self) -> Dict[str, Any]:
+        """Exporta la instantánea como diccionarios listos para serializar"""
+        return {
+            'version': self._version,
+            'usuarios': [u._asdict() for u in self._usuarios.values()],
+            'proyectos': [
+                {'id': p.id, 'nombre': p.nombre, 'descripcion': p.descripcion,
+                 'tareas': list(p.tareas)}
+                for p in self._proyectos.values()
+            ],
+            'tareas': [
+                {**t._asdict(), 'estado': t.estado.name, 'prioridad': t.prioridad.name,
+                 'fecha_completada': t.fecha_completada.isoformat() if t.fecha_completada else None}
+                for t in self._tareas.values()
+            ],
+        }
+
+
+class RegistroInstantaneas:
+    """Mantiene las vistas publicadas por los gestores y entrega instantáneas"""
+
+    def __init__(self):
+        self._candado = threading.Lock()
+        self._tareas = _MapaCopiaAlEscribir()
+        self._proyectos = _MapaCopiaAlEscribir()
+        self._usuarios = _MapaCopiaAlEscribir()
+        self._version = 0
+
+    def instantanea(self) -> Instantanea:
+        """Devuelve una instantánea consistente sin copiar las vistas"""
+        with self._candado:
+            return Instantanea(self._version, self._tareas.congelar(),
+                               self._proyectos.congelar(), self._usuarios.congelar())
+
+    def publicar_tareas(self, tareas: Iterable[Tarea]):
+        """Publica la vista actual de una o varias tareas"""
+        vistas = [VistaTarea.desde(t) for t in tareas]
+        with self._candado:
+            self._version += 1
+            for vista in vistas:
+                self._tareas.asignar(vista.id, vista)
+
+    def publicar_proyecto(self, proyecto: Proyecto, tareas: Iterable[Tarea] = ()):
+        """Publica la vista de un proyecto y, opcionalmente, de sus tareas nuevas"""
+        vista = VistaProyecto.desde(proyecto)
+        vistas_tareas = [VistaTarea.desde(t) for t in tareas]
+        with self._candado:
+            self._version += 1
+            self._proyectos.asignar(vista.id, vista)
+            for vista_tarea in vistas_tareas:
+                self._tareas.asignar(vista_tarea.id, vista_tarea)
+
+    def retirar_proyecto(self, proyecto_id: int):
+        """Quita un proyecto eliminado de las próximas instantáneas"""
+        with self._candado:
+            self._version += 1
+            self._proyectos.quitar(proyecto_id)
+
+    def publicar_usuario(self, usuario: Usuario):
+        """Publica la vista actual de un usuario"""
+        vista = VistaUsuario.desde(usuario)
+        with self._candado:
+            self._version += 1
+            self._usuarios.asignar(vista.id, vista)
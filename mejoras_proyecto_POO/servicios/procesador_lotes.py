@@ -0,0 +1,213 @@
+"""Procesador de lotes: ejecuta operaciones sobre los gestores sin interacción.
+
+Cada línea de entrada es un objeto JSON con la clave "op" y los argumentos
+de la operación. Por cada comando se emite una línea JSON con el resultado,
+de modo que la salida pueda ser procesada por otros programas.
+
+Ejemplo de entrada:
+    {"op": "crear_proyecto", "nombre": "Sprint 1", "ref": "p1"}
+    {"op": "crear_tarea_simple", "titulo": "Diseño", "prioridad": "ALTA", "ref": "t1"}
+    {"op": "agregar_tarea_a_proyecto", "proyecto_id": "@p1", "tarea_id": "@t1"}
+    {"op": "actualizar_estado_tarea", "tarea_id": "@t1", "estado": "COMPLETADA"}
+    {"op": "actualizar_estados", "tarea_ids": ["@t1", "@t2"], "estado": "EN_PROGRESO"}
+
+Los campos "ref" permiten nombrar el objeto creado para usar su ID en
+comandos posteriores mediante "@nombre".
+"""
+import json
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+
+from modelos.tarea import EstadoTarea, Prioridad
+from servicios.gestor_de_proyectos import GestorProyectos
+from servicios.gestor_de_tareas import GestorTareas
+from servicios.gestor_de_usuarios import GestorUsuarios
+
+
+class ProcesadorLotes:
+    """Ejecuta comandos en lote contra los gestores de servicios"""
+
+    def __init__(self, gestor_proyectos: Optional[GestorProyectos] = None,
+                 gestor_tareas: Optional[GestorTareas] = None,
+                 gestor_usuarios: Optional[GestorUsuarios] = None):
+        self.gestor_proyectos = gestor_proyectos or GestorProyectos()
+        self.gestor_tareas = gestor_tareas or GestorTareas()
+        self.gestor_usuarios = gestor_usuarios or GestorUsuarios()
+        self._referencias = {}
+        self._operaciones = {
+            'registrar_usuario': self._registrar_usuario,
+            'crear_proyecto': self._crear_proyecto,
+            'eliminar_proyecto': self._eliminar_proyecto,
+            'crear_tarea_simple': self._crear_tarea_simple,
+            'crear_tarea_compuesta': self._crear_tarea_compuesta,
+            'agregar_tarea_a_proyecto': self._agregar_tarea_a_proyecto,
+            'actualizar_estado_tarea': self._actualizar_estado_tarea,
+            'actualizar_estados': self._actualizar_estados,
+            'obtener_estadisticas_proyecto': self._obtener_estadisticas_proyecto,
+        }
+
+    def ejecutar(self, comando: Dict) -> Dict:
+        """Ejecuta un único comando y devuelve su resultado.
+
+        Cualquier error del comando se informa en el resultado; nunca
+        interrumpe el resto del lote.
+        """
+        if not isinstance(comando, dict):
+            return {'op': None, 'ok': False, 'error': "El comando debe ser un objeto JSON"}
+
+        op = comando.get('op')
+        operacion = self._operaciones.get(op) if isinstance(op, str) else None
+        if operacion is None:
+            return {'op': op, 'ok': False, 'error': f"Operación desconocida: {op}"}
+
+        ref = comando.get('ref')
+        if ref is not None and not isinstance(ref, str):
+            return {'op': op, 'ok': False, 'error': "El campo 'ref' debe ser texto"}
+
+        try:
+            resultado = operacion(comando)
+        except KeyError as e:
+            return {'op': op, 'ok': False, 'error': f"Falta el campo {e}"}
+        except Exception as e:
+            return {'op': op, 'ok': False, 'error': str(e) or type(e).__name__}
+
+        if ref is not None and 'id' in resultado:
+            self._referencias[ref] = resultado['id']
+
+        resultado['op'] = op
+        resultado.setdefault('ok', True)
+        return resultado
+
+    def ejecutar_lineas(self, lineas: Iterable[str],
+                        detener_en_error: bool = False) -> Iterator[Dict]:
+        """Ejecuta una secuencia de líneas JSON, ignorando vacías y comentarios"""
+        for numero, linea in enumerate(lineas, 1):
+            linea = linea.strip()
+            if not linea or linea.startswith('#'):
+                continue
+
+            try:
+                comando = json.loads(linea)
+            except json.JSONDecodeError as e:
+                resultado = {'op': None, 'ok': False, 'error': f"JSON inválido: {e}"}
+            else:
+                resultado = self.ejecutar(comando)
+
+            resultado['linea'] = numero
+            yield resultado
+            if detener_en_error and not resultado['ok']:
+                break
+
+    def procesar(self, entrada: TextIO, salida: TextIO,
+                 detener_en_error: bool = False) -> int:
+        """Procesa un flujo completo y escribe un resultado JSON por línea.
+
+        Devuelve el número de comandos que fallaron.
+        """
+        errores = 0
+        for resultado in self.ejecutar_lineas(entrada, detener_en_error):
+            if not resultado['ok']:
+                errores += 1
+            salida.write(json.dumps(resultado, ensure_ascii=False))
+            salida.write('\n')
+        salida.flush()
+        return errores
+
+    def _resolver_id(self, valor) -> int:
+        """Convierte un ID literal o una referencia '@nombre' en un ID numérico"""
+        if isinstance(valor, str) and valor.startswith('@'):
+            ref = valor[1:]
+            if ref not in self._referencias:
+                raise ValueError(f"Referencia no definida: {ref}")
+            return self._referencias[ref]
+        return int(valor)
+
+    @staticmethod
+    def _convertir_prioridad(valor) -> Prioridad:
+        """Acepta la prioridad por nombre (ALTA) o por valor (3)"""
+        if valor is None:
+            return Prioridad.MEDIA
+        if isinstance(valor, str) and not valor.isdigit():
+            if valor.upper() not in Prioridad.__members__:
+                raise ValueError(f"Prioridad inválida: {valor}")
+            return Prioridad[valor.upper()]
+        return Prioridad(int(valor))
+
+    @staticmethod
+    def _convertir_estado(valor) -> EstadoTarea:
+        """Acepta el estado por nombre (EN_PROGRESO) o por valor ("En progreso")"""
+        if isinstance(valor, str) and valor.upper() in EstadoTarea.__members__:
+            return EstadoTarea[valor.upper()]
+        return EstadoTarea(valor)
+
+    def _registrar_usuario(self, comando: Dict) -> Dict:
+        usuario = self.gestor_usuarios.registrar_usuario(
+            comando['nombre'], comando['email'], comando.get('rol', 'estudiante')
+        )
+        return {'id': usuario.id}
+
+    def _crear_proyecto(self, comando: Dict) -> Dict:
+        usuario = None
+        if 'usuario_id' in comando:
+            usuario = self.gestor_usuarios.obtener_usuario(self._resolver_id(comando['usuario_id']))
+            if not usuario:
+                raise ValueError("Usuario no encontrado")
+
+        proyecto = self.gestor_proyectos.crear_proyecto(
+            comando['nombre'], comando.get('descripcion', '')
+        )
+        if usuario:
+            usuario.agregar_proyecto(proyecto)
+        return {'id': proyecto.id}
+
+    def _eliminar_proyecto(self, comando: Dict) -> Dict:
+        if not self.gestor_proyectos.eliminar_proyecto(self._resolver_id(comando['proyecto_id'])):
+            raise ValueError("Proyecto no encontrado")
+        return {}
+
+    def _crear_tarea_simple(self, comando: Dict) -> Dict:
+        tarea = self.gestor_tareas.crear_tarea_simple(
+            comando['titulo'],
+            comando.get('descripcion', ''),
+            self._convertir_prioridad(comando.get('prioridad')),
+            int(comando.get('horas_estimadas', 1)),
+        )
+        return {'id': tarea.id}
+
+    def _crear_tarea_compuesta(self, comando: Dict) -> Dict:
+        tarea = self.gestor_tareas.crear_tarea_compuesta(
+            comando['titulo'],
+            comando.get('descripcion', ''),
+            self._convertir_prioridad(comando.get('prioridad')),
+        )
+        return {'id': tarea.id}
+
+    def _agregar_tarea_a_proyecto(self, comando: Dict) -> Dict:
+        tarea = self.gestor_tareas.obtener_tarea(self._resolver_id(comando['tarea_id']))
+        if not tarea:
+            raise ValueError("Tarea no encontrada")
+        if not self.gestor_proyectos.agregar_tarea_a_proyecto(
+                self._resolver_id(comando['proyecto_id']), tarea):
+            raise ValueError("Proyecto no encontrado")
+        return {}
+
+    def _actualizar_estado_tarea(self, comando: Dict) -> Dict:
+        if not self.gestor_tareas.actualizar_estado_tarea(
+                self._resolver_id(comando['tarea_id']),
+                self._convertir_estado(comando['estado'])):
+            raise ValueError("Tarea no encontrada")
+        return {}
+
+    def _actualizar_estados(self, comando: Dict) -> Dict:
+        resultados = self.gestor_tareas.actualizar_estados(
+            [self._resolver_id(tarea_id) for tarea_id in comando['tarea_ids']],
+            self._convertir_estado(comando['estado']),
+        )
+        return {'resultados': resultados}
+
+    def _obtener_estadisticas_proyecto(self, comando: Dict) -> Dict:
+        estadisticas = self.gestor_proyectos.obtener_estadisticas_proyecto(
+            self._resolver_id(comando['proyecto_id'])
+        )
+        if not estadisticas:
+            raise ValueError("Proyecto no encontrado")
+        return {'estadisticas': estadisticas}
@@ -0,0 +1,530 @@
+"""Replicación del estado de los gestores hacia procesos réplica.
+
+El primario ejecuta las mutaciones sobre sus gestores y las anota en una
+bitácora ordenada. Cada registro es una tupla compacta:
+
+    (offset, marca_ms, codigo_operacion, argumentos)
+
+Las réplicas se conectan por un socket local o un Pipe, envían el offset
+desde el que necesitan los registros ("ponerse al día") y luego reciben
+cada nueva mutación en cuanto ocurre. Al aplicarlos reproducen el estado
+del primario con los mismos IDs.
+
+Cada réplica tiene una cola de salida acotada que vacía su propio hilo, así
+que una réplica lenta nunca bloquea al primario: si la cola se llena se la
+desconecta y debe volver a conectarse desde su offset.
+
+Los mensajes entre procesos se serializan con pickle, por lo que el socket
+exige siempre una clave compartida: ambos extremos se autentican antes de
+intercambiar cualquier dato. Donde existe, se usa un socket AF_UNIX dentro
+de un directorio temporal accesible sólo por el usuario.
+"""
+import os
+import queue
+import secrets
+import socket
+import struct
+import tempfile
+import threading
+from collections import deque
+from datetime import datetime
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from modelos.historial import a_milisegundos, desde_milisegundos
+from modelos.proyecto import Proyecto
+from modelos.tarea import (Tarea, TareaSimple, TareaCompuesta, EstadoTarea, Prioridad,
+                           CODIGO_ESTADO, ESTADOS_POR_CODIGO)
+from modelos.usuario import Usuario, RolUsuario
+from servicios.gestor_de_proyectos import GestorProyectos
+from servicios.gestor_de_tareas import GestorTareas
+from servicios.gestor_de_usuarios import GestorUsuarios
+from servicios.instantaneas import Instantanea, RegistroInstantaneas
+
+# Códigos de operación de la bitácora
+OP_CREAR_PROYECTO = 1
+OP_ELIMINAR_PROYECTO = 2
+OP_REGISTRAR_USUARIO = 3
+OP_CREAR_TAREA_SIMPLE = 4
+OP_CREAR_TAREA_COMPUESTA = 5
+OP_CREAR_TAREAS_SIMPLES = 6
+OP_ACTUALIZAR_ESTADOS = 7
+OP_AGREGAR_TAREA_A_PROYECTO = 8
+OP_AGREGAR_TAREAS_A_PROYECTO = 9
+
+# Máximo de registros por mensaje al ponerse al día
+TAMANO_LOTE = 1000
+
+# Mensajes en cola por réplica antes de desconectarla
+LIMITE_COLA = 10000
+
+# Solicitud de puesta al día: el offset como entero de 64 bits (sin pickle)
+_SOLICITUD = struct.Struct('!q')
+
+Registro = Tuple[int, int, int, tuple]
+
+
+def _ahora() -> datetime:
+    """Fecha actual truncada a milisegundos, la resolución de la bitácora"""
+    return desde_milisegundos(a_milisegundos(datetime.now()))
+
+
+def _cortar(conexion: Connection):
+    """Interrumpe un envío bloqueado cerrando el socket en ambos sentidos"""
+    try:
+        duplicado = socket.socket(fileno=os.dup(conexion.fileno()))
+    except (OSError, ValueError):
+        return
+    try:
+        duplicado.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        duplicado.close()
+
+
+class _CanalReplica:
+    """Envío hacia una réplica: primero la puesta al día y luego la cola en vivo"""
+
+    def __init__(self, conexion: Connection, limite: int):
+        self._conexion = conexion
+        self._cola = queue.Queue(maxsize=limite)
+        self._cerrojo = threading.Lock()
+        self._activo = True
+
+    def encolar(self, mensaje) -> bool:
+        """Encola un mensaje sin esperar; desconecta la réplica si la cola está llena"""
+        if not self._activo:
+            return False
+        try:
+            self._cola.put_nowait(mensaje)
+        except queue.Full:
+            self.cerrar()
+            return False
+        return True
+
+    def cerrar(self):
+        """Detiene el envío aunque el hilo esté bloqueado escribiendo"""
+        with self._cerrojo:
+            self._activo = False
+            if not self._conexion.closed:
+                _cortar(self._conexion)
+        try:
+            self._cola.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def enviar(self, bitacora: List[Registro], desde: int, hasta: int):
+        """Envía bitacora[desde:hasta] en lotes y después los mensajes encolados"""
+        try:
+            for inicio in range(desde, hasta, TAMANO_LOTE):
+                if not self._activo:
+                    return
+                fin = min(inicio + TAMANO_LOTE, hasta)
+                self._conexion.send((len(bitacora), bitacora[inicio:fin]))
+            if desde == hasta:
+                self._conexion.send((hasta, []))
+            while self._activo:
+                mensaje = self._cola.get()
+                if mensaje is None:
+                    break
+                self._conexion.send(mensaje)
+        except (OSError, EOFError):
+            pass
+        finally:
+            with self._cerrojo:
+                self._activo = False
+                self._conexion.close()
+
+
+class Primario:
+    """Gestores que anotan sus mutaciones y las envían a las réplicas.
+
+    Todas las mutaciones deben hacerse a través de esta clase; los cambios
+    hechos directamente sobre los gestores o los modelos no se replican.
+    """
+
+    def __init__(self, gestor_proyectos: Optional[GestorProyectos] = None,
+                 gestor_tareas: Optional[GestorTareas] = None,
+                 gestor_usuarios: Optional[GestorUsuarios] = None,
+                 limite_cola: int = LIMITE_COLA):
+        self.gestor_proyectos = gestor_proyectos or GestorProyectos()
+        self.gestor_tareas = gestor_tareas or GestorTareas()
+        self.gestor_usuarios = gestor_usuarios or GestorUsuarios()
+        self._bitacora: List[Registro] = []
+        self._candado = threading.RLock()
+        self._limite_cola = limite_cola
+        self._replicas: List[_CanalReplica] = []
+        self._listener: Optional[Listener] = None
+        self._directorio: Optional[str] = None
+
+    @property
+    def offset(self) -> int:
+        """Offset del próximo registro de la bitácora"""
+        return len(self._bitacora)
+
+    def crear_proyecto(self, nombre: str, descripcion: str = "") -> Proyecto:
+        with self._candado:
+            proyecto = self.gestor_proyectos.crear_proyecto(nombre, descripcion)
+            self._anotar(OP_CREAR_PROYECTO, (proyecto.id, proyecto.nombre, proyecto._descripcion))
+            return proyecto
+
+    def eliminar_proyecto(self, proyecto_id: int) -> bool:
+        with self._candado:
+            eliminado = self.gestor_proyectos.eliminar_proyecto(proyecto_id)
+            if eliminado:
+                self._anotar(OP_ELIMINAR_PROYECTO, (proyecto_id,))
+            return eliminado
+
+    def registrar_usuario(self, nombre: str, email: str,
+                          rol: RolUsuario = RolUsuario.ESTUDIANTE) -> Usuario:
+        with self._candado:
+            usuario = self.gestor_usuarios.registrar_usuario(nombre, email, rol)
+            self._anotar(OP_REGISTRAR_USUARIO,
+                         (usuario.id, usuario.nombre, usuario.email, usuario.rol))
+            return usuario
+
+    def crear_tarea_simple(self, titulo: str, descripcion: str = "",
+                           prioridad: Prioridad = Prioridad.MEDIA,
+                           horas_estimadas: int = 1) -> TareaSimple:
+        self._validar_fila((titulo, descripcion, prioridad, horas_estimadas))
+        with self._candado:
+            tarea = self.gestor_tareas.crear_tarea_simple(titulo, descripcion, prioridad, horas_estimadas)
+            self._anotar(OP_CREAR_TAREA_SIMPLE,
+                         (tarea.id, tarea.titulo, tarea._descripcion, prioridad.value,
+                          tarea.horas_estimadas, a_milisegundos(tarea._fecha_creacion)))
+            return tarea
+
+    def crear_tarea_compuesta(self, titulo: str, descripcion: str = "",
+                              prioridad: Prioridad = Prioridad.MEDIA) -> TareaCompuesta:
+        self._validar_fila((titulo, descripcion, prioridad))
+        with self._candado:
+            tarea = self.gestor_tareas.crear_tarea_compuesta(titulo, descripcion, prioridad)
+            self._anotar(OP_CREAR_TAREA_COMPUESTA,
+                         (tarea.id, tarea.titulo, tarea._descripcion, prioridad.value,
+                          a_milisegundos(tarea._fecha_creacion)))
+            return tarea
+
+    def crear_tareas_simples(self, filas: Iterable[Sequence]) -> List[TareaSimple]:
+        with self._candado:
+            tareas = self.gestor_tareas.crear_tareas_simples(filas)
+            if tareas:
+                self._anotar(OP_CREAR_TAREAS_SIMPLES, (
+                    a_milisegundos(tareas[0]._fecha_creacion),
+                    tuple((t.id, t.titulo, t._descripcion, t._prioridad.value, t.horas_estimadas)
+                          for t in tareas),
+                ))
+            return tareas
+
+    def actualizar_estado_tarea(self, tarea_id: int, estado: EstadoTarea) -> bool:
+        return self.actualizar_estados((tarea_id,), estado)[0]
+
+    def actualizar_estados(self, tarea_ids: Iterable[int], estado: EstadoTarea) -> List[bool]:
+        if estado not in CODIGO_ESTADO:
+            raise ValueError("Estado inválido")
+        with self._candado:
+            tarea_ids = list(tarea_ids)
+            fecha = _ahora()
+            resultados = self.gestor_tareas.actualizar_estados(tarea_ids, estado, fecha)
+            actualizadas = tuple(i for i, ok in zip(tarea_ids, resultados) if ok)
+            if actualizadas:
+                self._anotar(OP_ACTUALIZAR_ESTADOS,
+                             (CODIGO_ESTADO[estado], a_milisegundos(fecha), actualizadas))
+            return resultados
+
+    def agregar_tarea_a_proyecto(self, proyecto_id: int, tarea: Tarea) -> bool:
+        with self._candado:
+            self._validar_tareas_propias((tarea,))
+            agregada = self.gestor_proyectos.agregar_tarea_a_proyecto(proyecto_id, tarea)
+            if agregada:
+                self._anotar(OP_AGREGAR_TAREA_A_PROYECTO, (proyecto_id, tarea.id))
+            return agregada
+
+    def agregar_tareas_a_proyecto(self, proyecto_id: int, tareas: Iterable[Tarea]) -> List[bool]:
+        with self._candado:
+            tareas = list(tareas)
+            self._validar_tareas_propias(tareas)
+            resultados = self.gestor_proyectos.agregar_tareas_a_proyecto(proyecto_id, tareas)
+            agregadas = tuple(t.id for t, ok in zip(tareas, resultados) if ok)
+            if agregadas:
+                self._anotar(OP_AGREGAR_TAREAS_A_PROYECTO, (proyecto_id, agregadas))
+            return resultados
+
+    def escuchar(self, direccion=None, authkey: Optional[bytes] = None) -> Tuple[Any, bytes]:
+        """Acepta réplicas autenticadas en un socket local.
+
+        Sin dirección se usa un socket AF_UNIX en un directorio privado (o
+        localhost en plataformas sin AF_UNIX). Sin clave se genera una
+        aleatoria. Devuelve (dirección, clave) para pasarlos a las réplicas.
+        """
+        authkey = authkey or secrets.token_bytes(32)
+        if direccion is None:
+            if hasattr(socket, 'AF_UNIX'):
+                self._directorio = tempfile.mkdtemp(prefix='replicacion-')
+                direccion = os.path.join(self._directorio, 'primario.sock')
+            else:
+                direccion = ('localhost', 0)
+
+        self._listener = Listener(direccion, authkey=authkey)
+        if isinstance(direccion, str) and hasattr(socket, 'AF_UNIX'):
+            os.chmod(direccion, 0o600)
+        threading.Thread(target=self._aceptar_replicas, daemon=True).start()
+        return self._listener.address, authkey
+
+    def agregar_replica(self, conexion: Connection):
+        """Atiende a una réplica ya conectada por un canal de confianza (un extremo de Pipe)"""
+        threading.Thread(target=self._iniciar_replica, args=(conexion,), daemon=True).start()
+
+    def cerrar(self):
+        """Deja de aceptar réplicas y cierra las conexiones abiertas"""
+        if self._listener:
+            self._listener.close()
+            self._listener = None
+        if self._directorio:
+            try:
+                os.rmdir(self._directorio)
+            except OSError:
+                pass
+            self._directorio = None
+        with self._candado:
+            for canal in self._replicas:
+                canal.cerrar()
+            self._replicas.clear()
+
+    def _aceptar_replicas(self):
+        """Método privado: acepta conexiones hasta que se cierra el listener"""
+        listener = self._listener
+        while True:
+            try:
+                conexion = listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                # Cliente sin la clave o que abandonó la autenticación
+                continue
+            except OSError:
+                break
+            self.agregar_replica(conexion)
+
+    def _iniciar_replica(self, conexion: Connection):
+        """Método privado: protocolo de puesta al día de una réplica.
+
+        La réplica envía su offset como entero binario (no se deserializa
+        con pickle). Con el candado sólo se fija el final de la puesta al
+        día y se registra la cola de la réplica; los lotes pendientes se
+        envían fuera del candado y a partir de ahí la cola en vivo.
+        """
+        try:
+            (desde,) = _SOLICITUD.unpack(conexion.recv_bytes(maxlength=_SOLICITUD.size))
+        except (OSError, EOFError, struct.error):
+            conexion.close()
+            return
+
+        canal = None
+        with self._candado:
+            hasta = len(self._bitacora)
+            if 0 <= desde <= hasta:
+                canal = _CanalReplica(conexion, self._limite_cola)
+                self._replicas.append(canal)
+
+        if canal is None:
+            try:
+                conexion.send(('error', f"Offset inválido: {desde}"))
+            except OSError:
+                pass
+            conexion.close()
+            return
+        # La bitácora sólo crece, así que el prefijo se puede leer sin candado
+        canal.enviar(self._bitacora, desde, hasta)
+
+    def _validar_fila(self, fila: tuple):
+        """Método privado: valida los datos de una tarea antes de crearla"""
+        error = self.gestor_tareas._validar_fila(fila)
+        if error:
+            raise ValueError(f"Datos de tarea inválidos: {error}")
+
+    def _validar_tareas_propias(self, tareas: Sequence[Tarea]):
+        """Método privado: sólo se replican tareas creadas a través del primario"""
+        for tarea in tareas:
+            if not isinstance(tarea, Tarea) or self.gestor_tareas.obtener_tarea(tarea.id) is not tarea:
+                raise ValueError("Sólo se pueden agregar tareas creadas por el primario")
+
+    def _anotar(self, operacion: int, argumentos: tuple):
+        """Método privado: agrega un registro a la bitácora y lo encola (con el candado)"""
+        registro = (len(self._bitacora), a_milisegundos(datetime.now()), operacion, argumentos)
+        self._bitacora.append(registro)
+        mensaje = (self.offset, [registro])
+        self._replicas = [canal for canal in self._replicas if canal.encolar(mensaje)]
+
+
+class Replica:
+    """Gestores en memoria que aplican la bitácora recibida del primario.
+
+    Mientras el hilo de iniciar() aplica registros, las lecturas deben
+    hacerse con instantanea(): los gestores publican cada cambio en el
+    registro de instantáneas y los lectores nunca ven un estado a medias.
+    Si se inyectan gestores, deben compartir el mismo registro.
+    """
+
+    def __init__(self, gestor_proyectos: Optional[GestorProyectos] = None,
+                 gestor_tareas: Optional[GestorTareas] = None,
+                 gestor_usuarios: Optional[GestorUsuarios] = None,
+                 registro: Optional[RegistroInstantaneas] = None):
+        self.registro = registro or RegistroInstantaneas()
+        self.gestor_proyectos = gestor_proyectos or GestorProyectos(self.registro)
+        self.gestor_tareas = gestor_tareas or GestorTareas(self.registro)
+        self.gestor_usuarios = gestor_usuarios or GestorUsuarios(self.registro)
+        self._offset = 0
+        self._offset_primario = 0
+        self._pendientes = deque()
+        self._candado = threading.RLock()
+        self._conexion: Optional[Connection] = None
+        self._aplicadores = {
+            OP_CREAR_PROYECTO: self._crear_proyecto,
+            OP_ELIMINAR_PROYECTO: self.gestor_proyectos.eliminar_proyecto,
+            OP_REGISTRAR_USUARIO: self._registrar_usuario,
+            OP_CREAR_TAREA_SIMPLE: self._crear_tarea_simple,
+            OP_CREAR_TAREA_COMPUESTA: self._crear_tarea_compuesta,
+            OP_CREAR_TAREAS_SIMPLES: self._crear_tareas_simples,
+            OP_ACTUALIZAR_ESTADOS: self._actualizar_estados,
+            OP_AGREGAR_TAREA_A_PROYECTO: self._agregar_tarea_a_proyecto,
+            OP_AGREGAR_TAREAS_A_PROYECTO: self._agregar_tareas_a_proyecto,
+        }
+
+    @property
+    def offset(self) -> int:
+        """Offset del próximo registro que espera la réplica"""
+        return self._offset
+
+    def instantanea(self) -> Instantanea:
+        """Vista consistente para leer mientras se aplican registros"""
+        return self.registro.instantanea()
+
+    def conectar(self, direccion, authkey: bytes):
+        """Se conecta al primario con la clave compartida y solicita los registros"""
+        self.sincronizar(Client(direccion, authkey=authkey))
+
+    def sincronizar(self, conexion: Connection):
+        """Inicia el protocolo de puesta al día sobre una conexión abierta"""
+        with self._candado:
+            self._conexion = conexion
+            self._pendientes.clear()
+            conexion.send_bytes(_SOLICITUD.pack(self._offset))
+
+    def recibir(self, timeout: Optional[float] = 0.0) -> int:
+        """Aplica los mensajes disponibles; espera hasta timeout por el primero.
+
+        Con timeout None espera indefinidamente. Devuelve cuántos registros
+        se aplicaron.
+        """
+        if not self._pendientes and not self._conexion.poll(timeout):
+            return 0
+        with self._candado:
+            self._leer_disponibles()
+            aplicados = 0
+            while self._pendientes:
+                aplicados += self.aplicar(self._pendientes.popleft())
+            return aplicados
+
+    def iniciar(self) -> threading.Thread:
+        """Aplica la bitácora en un hilo hasta que se cierre la conexión"""
+        hilo = threading.Thread(target=self._seguir_primario, daemon=True)
+        hilo.start()
+        return hilo
+
+    def aplicar(self, registro: Registro) -> int:
+        """Aplica un registro; ignora los ya aplicados y rechaza los huecos"""
+        offset, marca, operacion, argumentos = registro
+        if offset < self._offset:
+            return 0
+        if offset > self._offset:
+            raise ValueError(f"Falta el registro {self._offset} de la bitácora (llegó {offset})")
+
+        self._aplicadores[operacion](*argumentos)
+        self._offset = offset + 1
+        return 1
+
+    def retraso(self) -> Dict:
+        """Métrica de retraso respecto al primario.
+
+        Lee (sin aplicar) los mensajes que ya esperan en la conexión para
+        conocer el offset más reciente del primario. 'entradas' son los
+        registros aún no aplicados y 'segundos' la antigüedad del más
+        antiguo de ellos (0 si la réplica está al día).
+        """
+        with self._candado:
+            if self._conexion is not None:
+                try:
+                    self._leer_disponibles()
+                except (OSError, EOFError):
+                    pass
+            entradas = max(0, self._offset_primario - self._offset)
+            segundos = 0.0
+            if self._pendientes:
+                segundos = max(0.0, (a_milisegundos(datetime.now()) - self._pendientes[0][1]) / 1000)
+            return {'offset': self._offset, 'offset_primario': self._offset_primario,
+                    'entradas': entradas, 'segundos': segundos}
+
+    def _leer_disponibles(self):
+        """Método privado: mueve a la cola los mensajes ya recibidos (con el candado)"""
+        while self._conexion.poll(0):
+            offset_primario, registros = self._conexion.recv()
+            if offset_primario == 'error':
+                raise ValueError(registros)
+            self._offset_primario = max(self._offset_primario, offset_primario)
+            self._pendientes.extend(registros)
+
+    def _seguir_primario(self):
+        """Método privado: ciclo del hilo de replicación"""
+        try:
+            while True:
+                # Espera acotada: retraso() puede dejar mensajes en la cola
+                self.recibir(timeout=0.5)
+        except (OSError, EOFError):
+            pass
+
+    def _crear_proyecto(self, proyecto_id: int, nombre: str, descripcion: str):
+        proyecto = Proyecto(nombre, descripcion)
+        proyecto._id = proyecto_id
+        self.gestor_proyectos._registrar_proyecto(proyecto)
+
+    def _registrar_usuario(self, usuario_id: int, nombre: str, email: str, rol: str):
+        usuario = Usuario(nombre, email, rol)
+        usuario._id = usuario_id
+        self.gestor_usuarios._registrar_usuario(usuario)
+
+    def _crear_tarea_simple(self, tarea_id: int, titulo: str, descripcion: str,
+                            prioridad: int, horas: int, marca_creacion: int):
+        tarea = TareaSimple(titulo, descripcion, Prioridad(prioridad), horas,
+                            fecha_creacion=desde_milisegundos(marca_creacion))
+        tarea._id = tarea_id
+        self.gestor_tareas._registrar_tarea(tarea)
+
+    def _crear_tarea_compuesta(self, tarea_id: int, titulo: str, descripcion: str,
+                               prioridad: int, marca_creacion: int):
+        tarea = TareaCompuesta(titulo, descripcion, Prioridad(prioridad),
+                               fecha_creacion=desde_milisegundos(marca_creacion))
+        tarea._id = tarea_id
+        self.gestor_tareas._registrar_tarea(tarea)
+
+    def _crear_tareas_simples(self, marca_creacion: int, filas: tuple):
+        fecha = desde_milisegundos(marca_creacion)
+        tareas = []
+        for tarea_id, titulo, descripcion, prioridad, horas in filas:
+            tarea = TareaSimple(titulo, descripcion, Prioridad(prioridad), horas, fecha_creacion=fecha)
+            tarea._id = tarea_id
+            tareas.append(tarea)
+        self.gestor_tareas._registrar_tareas(tareas, fecha)
+
+    def _actualizar_estados(self, codigo: int, marca: int, tarea_ids: tuple):
+        self.gestor_tareas.actualizar_estados(tarea_ids, ESTADOS_POR_CODIGO[codigo],
+                                              desde_milisegundos(marca))
+
+    def _agregar_tarea_a_proyecto(self, proyecto_id: int, tarea_id: int):
+        self.gestor_proyectos.agregar_tarea_a_proyecto(
+            proyecto_id, self.gestor_tareas.obtener_tarea(tarea_id)
+        )
+
+    def _agregar_tareas_a_proyecto(self, proyecto_id: int, tarea_ids: tuple):
+        self.gestor_proyectos.agregar_tareas_a_proyecto(
+            proyecto_id, [self.gestor_tareas.obtener_tarea(i) for i in tarea_ids]
+        )
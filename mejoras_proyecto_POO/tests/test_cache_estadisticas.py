@@ -0,0 +1,62 @@
+"""Pruebas de la caché LRU"""
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from servicios.cache_estadisticas import CacheLRU
+
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+class TestCacheLRU(unittest.TestCase):
+
+    def test_desaloja_el_menos_usado(self):
+        cache = CacheLRU(capacidad=2)
+        cache.guardar('a', 1)
+        cache.guardar('b', 2)
+        self.assertEqual(cache.obtener_o_calcular('a', lambda: -1), 1)
+        cache.guardar('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.obtener_o_calcular('b', lambda: 20), 20)
+        self.assertEqual(cache.estadisticas(), {'entradas': 2, 'capacidad': 2, 'aciertos': 1,
+                                                'fallos': 1, 'desalojos': 2})
+
+    def test_ttl_vence_entradas(self):
+        reloj = RelojFalso()
+        cache = CacheLRU(ttl=10, reloj=reloj)
+        self.assertEqual(cache.obtener_o_calcular('a', lambda: 1), 1)
+        reloj.ahora = 9.9
+        self.assertEqual(cache.obtener_o_calcular('a', lambda: 2), 1)
+        reloj.ahora = 10
+        self.assertEqual(cache.obtener_o_calcular('a', lambda: 3), 3)
+        self.assertEqual((cache.aciertos, cache.fallos), (1, 2))
+
+    def test_invalidar_y_limpiar(self):
+        cache = CacheLRU()
+        cache.guardar('a', 1)
+        self.assertTrue(cache.invalidar('a'))
+        self.assertFalse(cache.invalidar('a'))
+        self.assertEqual(cache.obtener_o_calcular('a', lambda: 2), 2)
+
+        cache.limpiar()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.fallos, 1)
+
+    def test_parametros_invalidos(self):
+        with self.assertRaises(ValueError):
+            CacheLRU(capacidad=0)
+        with self.assertRaises(ValueError):
+            CacheLRU(ttl=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
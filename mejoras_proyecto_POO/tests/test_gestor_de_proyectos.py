@@ -0,0 +1,93 @@
+"""Pruebas del gestor de proyectos"""
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos.tarea import EstadoTarea
+from servicios.cache_estadisticas import CacheLRU
+from servicios.gestor_de_proyectos import GestorProyectos
+from servicios.gestor_de_tareas import GestorTareas
+from servicios.procesador_lotes import ProcesadorLotes
+
+
+class TestAgregarTareasAProyecto(unittest.TestCase):
+
+    def setUp(self):
+        self.gestor_tareas = GestorTareas()
+        self.gestor_proyectos = GestorProyectos()
+        self.proyecto = self.gestor_proyectos.crear_proyecto("Sprint")
+
+    def test_omite_duplicados(self):
+        a, b, c = self.gestor_tareas.crear_tareas_simples([("A",), ("B",), ("C",)])
+        self.gestor_proyectos.agregar_tarea_a_proyecto(self.proyecto.id, a)
+
+        resultados = self.gestor_proyectos.agregar_tareas_a_proyecto(self.proyecto.id, [a, b, b, c])
+        self.assertEqual(resultados, [False, True, False, True])
+        self.assertEqual([t.id for t in self.proyecto.tareas], [a.id, b.id, c.id])
+
+    def test_proyecto_inexistente(self):
+        tareas = self.gestor_tareas.crear_tareas_simples([("A",), ("B",)])
+        self.assertEqual(self.gestor_proyectos.agregar_tareas_a_proyecto(-1, tareas), [False, False])
+
+
+class TestCacheDeEstadisticas(unittest.TestCase):
+
+    def setUp(self):
+        self.gestor_tareas = GestorTareas()
+        self.cache = CacheLRU()
+        self.gestor_proyectos = GestorProyectos(cache=self.cache)
+        self.proyecto = self.gestor_proyectos.crear_proyecto("Sprint")
+        self.tarea = self.gestor_tareas.crear_tarea_simple("Diseño")
+        self.gestor_proyectos.agregar_tarea_a_proyecto(self.proyecto.id, self.tarea)
+
+    def progreso(self) -> float:
+        return self.gestor_proyectos.obtener_progreso_proyecto(self.proyecto.id)
+
+    def test_se_invalida_sin_suscripcion_manual(self):
+        self.assertEqual(self.progreso(), 0.0)
+        self.gestor_tareas.actualizar_estado_tarea(self.tarea.id, EstadoTarea.COMPLETADA)
+        self.assertEqual(self.progreso(), 100.0)
+
+    def test_se_invalida_al_cambiar_la_tarea_directamente(self):
+        self.assertEqual(self.progreso(), 0.0)
+        self.tarea.estado = EstadoTarea.COMPLETADA
+        self.assertEqual(self.progreso(), 100.0)
+
+    def test_reutiliza_el_calculo_mientras_no_hay_cambios(self):
+        self.progreso()
+        self.progreso()
+        self.assertEqual((self.cache.fallos, self.cache.aciertos), (1, 1))
+
+        otra = self.gestor_tareas.crear_tarea_simple("Código")
+        self.gestor_proyectos.agregar_tareas_a_proyecto(self.proyecto.id, [otra])
+        self.assertEqual(self.gestor_proyectos.obtener_estadisticas_proyecto(
+            self.proyecto.id)['total_tareas'], 2)
+
+    def test_eliminar_proyecto_limpia_la_pertenencia(self):
+        otro = self.gestor_proyectos.crear_proyecto("Otro")
+        self.gestor_proyectos.agregar_tarea_a_proyecto(otro.id, self.tarea)
+
+        self.gestor_proyectos.eliminar_proyecto(self.proyecto.id)
+        self.assertEqual(self.gestor_proyectos._proyectos_por_tarea, {self.tarea.id: {otro.id}})
+        self.gestor_proyectos.eliminar_proyecto(otro.id)
+        self.assertEqual(self.gestor_proyectos._proyectos_por_tarea, {})
+        self.assertFalse(self.tarea._observadores)
+
+    def test_procesador_de_lotes_con_cache(self):
+        procesador = ProcesadorLotes(GestorProyectos(cache=CacheLRU()))
+        for comando in (
+            {"op": "crear_proyecto", "nombre": "Sprint", "ref": "p"},
+            {"op": "crear_tarea_simple", "titulo": "Diseño", "ref": "t"},
+            {"op": "agregar_tarea_a_proyecto", "proyecto_id": "@p", "tarea_id": "@t"},
+            {"op": "obtener_estadisticas_proyecto", "proyecto_id": "@p"},
+            {"op": "actualizar_estado_tarea", "tarea_id": "@t", "estado": "COMPLETADA"},
+        ):
+            procesador.ejecutar(comando)
+        resultado = procesador.ejecutar({"op": "obtener_estadisticas_proyecto", "proyecto_id": "@p"})
+        self.assertEqual(resultado['estadisticas']['progreso'], 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
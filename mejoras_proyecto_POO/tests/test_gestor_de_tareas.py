@@ -0,0 +1,101 @@
+"""Pruebas del gestor de tareas"""
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos.tarea import CODIGO_ESTADO, EstadoTarea, Prioridad
+from servicios.gestor_de_tareas import GestorTareas
+
+
+DIA_0 = datetime(2024, 1, 1)
+
+
+def dia(n: int) -> datetime:
+    return DIA_0 + timedelta(days=n)
+
+
+class TestTareasCompletadasEntre(unittest.TestCase):
+
+    def setUp(self):
+        self.gestor = GestorTareas()
+        self.tarea = self.gestor.crear_tarea_simple("Diseño")
+
+    def completadas(self, desde: int, hasta: int):
+        return self.gestor.obtener_tareas_completadas_entre(dia(desde), dia(hasta))
+
+    def test_completada_en_el_rango(self):
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(1))
+        self.assertEqual(self.completadas(0, 3), [self.tarea])
+        self.assertEqual(self.completadas(4, 6), [])
+
+    def test_reabierta_no_aparece(self):
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(1))
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.EN_PROGRESO, dia(2))
+        self.assertEqual(self.completadas(0, 3), [])
+        # Sigue disponible como transición histórica
+        self.assertEqual(self.gestor.obtener_tareas_que_entraron_en(
+            EstadoTarea.COMPLETADA, dia(0), dia(3)), [self.tarea])
+
+    def test_completada_de_nuevo_solo_cuenta_la_ultima(self):
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(1))
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.EN_PROGRESO, dia(2))
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(10))
+        self.assertEqual(self.completadas(0, 3), [])
+        self.assertEqual(self.completadas(9, 11), [self.tarea])
+
+    def test_marcar_completada_otra_vez_conserva_la_fecha(self):
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(1))
+        self.gestor.actualizar_estados([self.tarea.id], EstadoTarea.COMPLETADA, dia(5))
+        self.assertEqual(self.tarea._fecha_completada, dia(1))
+        self.assertEqual(self.completadas(0, 3), [self.tarea])
+
+
+class TestCrearTareasSimples(unittest.TestCase):
+
+    def setUp(self):
+        self.gestor = GestorTareas()
+
+    def test_crea_todas_con_la_misma_fecha(self):
+        tareas = self.gestor.crear_tareas_simples([
+            ("Diseño",),
+            ("Código", "Implementar"),
+            ("Pruebas", "", Prioridad.ALTA),
+            ("Despliegue", "", Prioridad.BAJA, 3),
+        ])
+        self.assertEqual(len(tareas), 4)
+        self.assertEqual(len({t._fecha_creacion for t in tareas}), 1)
+        self.assertEqual(tareas[3].horas_estimadas, 3)
+        self.assertEqual(tareas[2]._prioridad, Prioridad.ALTA)
+
+        fecha = tareas[0]._fecha_creacion
+        indice = self.gestor._indice
+        codigo = CODIGO_ESTADO[EstadoTarea.PENDIENTE]
+        self.assertEqual(indice.consultar(codigo, fecha, fecha), [t.id for t in tareas])
+        self.assertEqual(len(set(indice._marcas[codigo])), 1)
+
+    def test_informa_todas_las_filas_invalidas_sin_crear_ninguna(self):
+        with self.assertRaises(ValueError) as contexto:
+            self.gestor.crear_tareas_simples([
+                ("Válida",),
+                ("",),
+                ("Prioridad", "", "ALTA"),
+                ("Horas", "", Prioridad.MEDIA, 0),
+                ("Horas", "", Prioridad.MEDIA, True),
+                ("Descripción", 5),
+                (),
+            ])
+        mensaje = str(contexto.exception)
+        for fila in ("1 (", "2 (", "3 (", "4 (", "5 (", "6 ("):
+            self.assertIn(fila, mensaje)
+        self.assertNotIn("0 (", mensaje)
+        self.assertEqual(self.gestor.obtener_tareas_pendientes(), [])
+
+    def test_lote_vacio(self):
+        self.assertEqual(self.gestor.crear_tareas_simples([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
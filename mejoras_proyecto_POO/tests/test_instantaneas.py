@@ -0,0 +1,88 @@
+"""Pruebas de las instantáneas de solo lectura"""
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos.tarea import EstadoTarea
+from servicios.gestor_de_proyectos import GestorProyectos
+from servicios.gestor_de_tareas import GestorTareas
+from servicios.gestor_de_usuarios import GestorUsuarios
+from servicios.instantaneas import NUM_FRAGMENTOS, RegistroInstantaneas
+
+
+class TestInstantaneas(unittest.TestCase):
+
+    def setUp(self):
+        self.registro = RegistroInstantaneas()
+        self.gestor_tareas = GestorTareas(self.registro)
+        self.gestor_proyectos = GestorProyectos(self.registro)
+        self.gestor_usuarios = GestorUsuarios(self.registro)
+
+    def test_escrituras_posteriores_no_alteran_la_instantanea(self):
+        tarea = self.gestor_tareas.crear_tarea_simple("Diseño")
+        antes = self.registro.instantanea()
+
+        self.gestor_tareas.actualizar_estado_tarea(tarea.id, EstadoTarea.COMPLETADA)
+        nueva = self.gestor_tareas.crear_tarea_simple("Código")
+        usuario = self.gestor_usuarios.registrar_usuario("Ana", "ana@example.com", "estudiante")
+        despues = self.registro.instantanea()
+
+        self.assertEqual(antes.tareas[tarea.id].estado, EstadoTarea.PENDIENTE)
+        self.assertNotIn(nueva.id, antes.tareas)
+        self.assertNotIn(usuario.id, antes.usuarios)
+        self.assertEqual(len(antes.tareas), 1)
+
+        self.assertEqual(despues.tareas[tarea.id].estado, EstadoTarea.COMPLETADA)
+        self.assertEqual(len(despues.tareas), 2)
+        self.assertGreater(despues.version, antes.version)
+
+    def test_eliminar_proyecto_no_afecta_instantaneas_previas(self):
+        proyecto = self.gestor_proyectos.crear_proyecto("Sprint")
+        antes = self.registro.instantanea()
+
+        self.gestor_proyectos.eliminar_proyecto(proyecto.id)
+        despues = self.registro.instantanea()
+
+        self.assertIn(proyecto.id, antes.proyectos)
+        self.assertNotIn(proyecto.id, despues.proyectos)
+        self.assertEqual(len(despues.proyectos), 0)
+
+    def test_agregar_tareas_en_lote_no_altera_la_instantanea(self):
+        proyecto = self.gestor_proyectos.crear_proyecto("Sprint")
+        primera = self.gestor_tareas.crear_tarea_simple("Diseño")
+        self.gestor_proyectos.agregar_tarea_a_proyecto(proyecto.id, primera)
+        antes = self.registro.instantanea()
+
+        tareas = self.gestor_tareas.crear_tareas_simples([(f"Tarea {i}",) for i in range(50)])
+        self.gestor_proyectos.agregar_tareas_a_proyecto(proyecto.id, tareas)
+        self.gestor_tareas.actualizar_estados([t.id for t in tareas], EstadoTarea.COMPLETADA)
+        despues = self.registro.instantanea()
+
+        self.assertEqual(antes.proyectos[proyecto.id].tareas, (primera.id,))
+        self.assertEqual(antes.obtener_estadisticas_proyecto(proyecto.id)['total_tareas'], 1)
+        self.assertEqual(len(despues.proyectos[proyecto.id].tareas), 51)
+        self.assertEqual(despues.obtener_estadisticas_proyecto(proyecto.id)['tareas_completadas'], 50)
+
+    def test_muchas_claves_se_reparten_entre_fragmentos(self):
+        tareas = self.gestor_tareas.crear_tareas_simples([(f"Tarea {i}",) for i in range(2000)])
+        instantanea = self.registro.instantanea()
+
+        self.assertEqual(len(instantanea.tareas), 2000)
+        self.assertEqual(set(instantanea.tareas), {t.id for t in tareas})
+        usados = sum(1 for f in instantanea.tareas._fragmentos if f)
+        self.assertGreater(usados, NUM_FRAGMENTOS // 2)
+
+    def test_exportar(self):
+        proyecto = self.gestor_proyectos.crear_proyecto("Sprint")
+        tarea = self.gestor_tareas.crear_tarea_simple("Diseño")
+        self.gestor_proyectos.agregar_tarea_a_proyecto(proyecto.id, tarea)
+
+        datos = self.registro.instantanea().exportar()
+        self.assertEqual(datos['proyectos'][0]['tareas'], [tarea.id])
+        self.assertEqual(datos['tareas'][0]['estado'], 'PENDIENTE')
+
+
+if __name__ == '__main__':
+    unittest.main()
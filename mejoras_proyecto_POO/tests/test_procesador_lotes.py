@@ -0,0 +1,65 @@
+"""Pruebas del procesador de comandos en lote"""
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(DIRECTORIO_PROYECTO)
+
+from servicios.procesador_lotes import ProcesadorLotes
+
+
+class TestProcesadorLotes(unittest.TestCase):
+
+    def procesar(self, *comandos):
+        entrada = io.StringIO('\n'.join(c if isinstance(c, str) else json.dumps(c)
+                                        for c in comandos))
+        salida = io.StringIO()
+        errores = ProcesadorLotes().procesar(entrada, salida)
+        return errores, [json.loads(linea) for linea in salida.getvalue().splitlines()]
+
+    def test_referencias_entre_comandos(self):
+        errores, resultados = self.procesar(
+            {"op": "crear_proyecto", "nombre": "Sprint", "ref": "p"},
+            {"op": "crear_tarea_simple", "titulo": "Diseño", "ref": "t"},
+            {"op": "agregar_tarea_a_proyecto", "proyecto_id": "@p", "tarea_id": "@t"},
+            {"op": "actualizar_estado_tarea", "tarea_id": "@t", "estado": "COMPLETADA"},
+            {"op": "obtener_estadisticas_proyecto", "proyecto_id": "@p"},
+        )
+        self.assertEqual(errores, 0)
+        self.assertEqual(resultados[-1]['estadisticas']['progreso'], 100.0)
+
+    def test_errores_no_detienen_el_lote(self):
+        errores, resultados = self.procesar(
+            '[1, 2]',
+            '{no es json',
+            {"op": "crear_proyecto", "nombre": "x", "ref": ["a"]},
+            {"op": "crear_tarea_simple", "titulo": "t", "prioridad": "FOO"},
+            {"op": "crear_tarea_simple"},
+            {"op": "agregar_tarea_a_proyecto", "proyecto_id": "@nada", "tarea_id": 1},
+            {"op": "crear_proyecto", "nombre": "y"},
+        )
+        self.assertEqual(errores, 6)
+        self.assertEqual(len(resultados), 7)
+        self.assertEqual(resultados[2]['error'], "El campo 'ref' debe ser texto")
+        self.assertEqual(resultados[3]['error'], "Prioridad inválida: FOO")
+        self.assertEqual(resultados[4]['error'], "Falta el campo 'titulo'")
+        self.assertTrue(all(r['error'] for r in resultados[:6]))
+        self.assertTrue(resultados[6]['ok'])
+
+    def test_archivo_inexistente(self):
+        proceso = subprocess.run(
+            [sys.executable, os.path.join(DIRECTORIO_PROYECTO, 'main.py'),
+             '--lote', os.path.join(DIRECTORIO_PROYECTO, 'no_existe.jsonl')],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(proceso.returncode, 2)
+        self.assertIn("No se pudo abrir el archivo de lote", proceso.stderr)
+        self.assertNotIn("Traceback", proceso.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
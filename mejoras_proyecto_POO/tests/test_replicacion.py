@@ -0,0 +1,174 @@
+"""Pruebas de la replicación entre un primario y sus réplicas"""
+import os
+import sys
+import threading
+import unittest
+from multiprocessing import AuthenticationError, Pipe
+from multiprocessing.connection import Client
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelos.tarea import EstadoTarea, Prioridad
+from servicios.replicacion import Primario, Replica
+
+
+class TestReplicacion(unittest.TestCase):
+
+    def setUp(self):
+        self.primario = Primario()
+
+    def tearDown(self):
+        self.primario.cerrar()
+
+    def conectar_por_pipe(self, replica: Replica):
+        extremo_primario, extremo_replica = Pipe()
+        self.primario.agregar_replica(extremo_primario)
+        replica.sincronizar(extremo_replica)
+        return extremo_replica
+
+    def esperar(self, replica: Replica, offset: int):
+        while replica.offset < offset:
+            if not replica.recibir(timeout=2):
+                self.fail(f"La réplica no llegó al offset {offset}")
+
+    def test_ida_y_vuelta_y_puesta_al_dia(self):
+        proyecto = self.primario.crear_proyecto("Sprint", "Primer sprint")
+        tarea = self.primario.crear_tarea_simple("Diseño", "", Prioridad.ALTA, 3)
+        self.primario.agregar_tarea_a_proyecto(proyecto.id, tarea)
+
+        replica = Replica()
+        conexion = self.conectar_por_pipe(replica)
+        self.esperar(replica, self.primario.offset)
+        conexion.close()
+
+        # Cambios mientras la réplica está desconectada
+        self.primario.actualizar_estado_tarea(tarea.id, EstadoTarea.COMPLETADA)
+        nuevas = self.primario.crear_tareas_simples([("Código",), ("Pruebas", "", Prioridad.BAJA, 2)])
+
+        self.conectar_por_pipe(replica)
+        self.esperar(replica, self.primario.offset)
+
+        copia = replica.gestor_tareas.obtener_tarea(tarea.id)
+        self.assertEqual(copia.estado, EstadoTarea.COMPLETADA)
+        self.assertEqual([t.titulo for t in replica.gestor_tareas.obtener_tareas_pendientes()],
+                         [t.titulo for t in nuevas])
+        self.assertEqual(replica.gestor_proyectos.obtener_estadisticas_proyecto(proyecto.id),
+                         self.primario.gestor_proyectos.obtener_estadisticas_proyecto(proyecto.id))
+
+    def test_duplicados_y_huecos(self):
+        self.primario.crear_proyecto("A")
+        self.primario.crear_proyecto("B")
+        primero, segundo = self.primario._bitacora
+
+        replica = Replica()
+        self.assertEqual(replica.aplicar(primero), 1)
+        self.assertEqual(replica.aplicar(primero), 0)
+        self.assertEqual(replica.offset, 1)
+
+        otra = Replica()
+        with self.assertRaises(ValueError):
+            otra.aplicar(segundo)
+        self.assertEqual(otra.offset, 0)
+
+    def test_retraso_cuenta_registros_sin_aplicar(self):
+        replica = Replica()
+        self.conectar_por_pipe(replica)
+        self.primario.crear_proyecto("A")
+        self.primario.crear_proyecto("B")
+
+        while replica.retraso()['entradas'] < 2:
+            replica._conexion.poll(2)
+        retraso = replica.retraso()
+        self.assertEqual(retraso['entradas'], 2)
+        self.assertGreaterEqual(retraso['segundos'], 0)
+
+        replica.recibir()
+        self.assertEqual(replica.retraso(), {'offset': 2, 'offset_primario': 2,
+                                             'entradas': 0, 'segundos': 0.0})
+
+    def test_datos_invalidos_no_mutan_ni_anotan(self):
+        with self.assertRaises(ValueError):
+            self.primario.crear_tareas_simples([('a', 'd', 'ALTA')])
+        with self.assertRaises(ValueError):
+            self.primario.crear_tarea_simple('a', 'd', 'ALTA')
+        with self.assertRaises(ValueError):
+            self.primario.actualizar_estados([1], 'Completada')
+
+        proyecto = self.primario.crear_proyecto("A")
+        with self.assertRaises(ValueError):
+            self.primario.agregar_tarea_a_proyecto(proyecto.id, "no es tarea")
+
+        self.assertEqual(self.primario.gestor_tareas.obtener_tareas_pendientes(), [])
+        self.assertEqual(self.primario.offset, 1)
+
+    def test_socket_exige_clave(self):
+        direccion, clave = self.primario.escuchar()
+        self.primario.crear_proyecto("A")
+
+        with self.assertRaises(AuthenticationError):
+            Client(direccion, authkey=b'clave incorrecta')
+
+        replica = Replica()
+        replica.conectar(direccion, clave)
+        self.esperar(replica, 1)
+        self.assertEqual(len(replica.gestor_proyectos.listar_proyectos()), 1)
+
+
+    def test_replica_detenida_no_bloquea_al_primario(self):
+        primario = Primario(limite_cola=50)
+        self.addCleanup(primario.cerrar)
+        replica = Replica()
+        extremo_primario, extremo_replica = Pipe()
+        primario.agregar_replica(extremo_primario)
+        replica.sincronizar(extremo_replica)
+        # La réplica nunca llama a recibir()
+
+        def escribir():
+            for i in range(3000):
+                primario.crear_proyecto(f"Proyecto {i}", "x" * 200)
+
+        escritor = threading.Thread(target=escribir, daemon=True)
+        escritor.start()
+        escritor.join(timeout=10)
+        self.assertFalse(escritor.is_alive(), "El primario quedó bloqueado por la réplica")
+        self.assertEqual(primario.offset, 3000)
+        self.assertEqual(primario._replicas, [])
+
+        # La réplica desconectada vuelve a ponerse al día desde su offset
+        with self.assertRaises((EOFError, OSError)):
+            while True:
+                replica.recibir(timeout=2)
+        extremo_primario, extremo_replica = Pipe()
+        primario.agregar_replica(extremo_primario)
+        replica.sincronizar(extremo_replica)
+        self.esperar(replica, primario.offset)
+        self.assertEqual(len(replica.instantanea().proyectos), 3000)
+
+    def test_lecturas_concurrentes_con_la_aplicacion(self):
+        replica = Replica()
+        self.conectar_por_pipe(replica)
+        hilo = replica.iniciar()
+
+        lotes, tamano = 40, 250
+        for i in range(lotes):
+            self.primario.crear_tareas_simples([(f"Tarea {i}-{j}",) for j in range(tamano)])
+
+        errores = []
+        while replica.offset < lotes:
+            try:
+                instantanea = replica.instantanea()
+                tareas = list(instantanea.tareas.values())
+                # Cada lote se publica completo o no se publica
+                self.assertEqual(len(tareas) % tamano, 0)
+            except Exception as e:
+                errores.append(e)
+                break
+
+        self.assertEqual(errores, [])
+        self.assertEqual(len(replica.instantanea().tareas), lotes * tamano)
+        self.primario.cerrar()
+        hilo.join(timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
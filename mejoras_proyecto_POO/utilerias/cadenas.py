@@ -0,0 +1,15 @@
+"""Módulo para compartir una sola instancia de las cadenas repetidas"""
+import sys
+from typing import Optional
+
+
+def internar(valor: Optional[str]) -> Optional[str]:
+    """Devuelve la instancia compartida de una cadena.
+
+    Las cadenas iguales (títulos de plantillas, descripciones repetidas)
+    pasan a ocupar memoria una sola vez. Las cadenas internadas se liberan
+    cuando ningún objeto las referencia.
+    """
+    if not valor:
+        return valor
+    return sys.intern(valor)